@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'UI/app.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(800, 600)
+        self.verticalLayout = QtWidgets.QVBoxLayout(MainWindow)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.formLayout = QtWidgets.QFormLayout()
+        self.formLayout.setObjectName("formLayout")
+        self.label = QtWidgets.QLabel(MainWindow)
+        self.label.setObjectName("label")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label)
+        self.lineEdit_search_keywords = QtWidgets.QLineEdit(MainWindow)
+        self.lineEdit_search_keywords.setObjectName("lineEdit_search_keywords")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.lineEdit_search_keywords)
+        self.label_2 = QtWidgets.QLabel(MainWindow)
+        self.label_2.setObjectName("label_2")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label_2)
+        self.lineEdit_state = QtWidgets.QLineEdit(MainWindow)
+        self.lineEdit_state.setObjectName("lineEdit_state")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.lineEdit_state)
+        self.verticalLayout.addLayout(self.formLayout)
+        self.label_3 = QtWidgets.QLabel(MainWindow)
+        self.label_3.setObjectName("label_3")
+        self.verticalLayout.addWidget(self.label_3)
+        self.textEdit_count = QtWidgets.QTextEdit(MainWindow)
+        self.textEdit_count.setMaximumHeight(50)
+        self.textEdit_count.setReadOnly(True)
+        self.textEdit_count.setObjectName("textEdit_count")
+        self.verticalLayout.addWidget(self.textEdit_count)
+        self.label_jobs = QtWidgets.QLabel(MainWindow)
+        self.label_jobs.setObjectName("label_jobs")
+        self.verticalLayout.addWidget(self.label_jobs)
+        self.tableWidget_jobs = QtWidgets.QTableWidget(MainWindow)
+        self.tableWidget_jobs.setMaximumHeight(150)
+        self.tableWidget_jobs.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tableWidget_jobs.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.tableWidget_jobs.setObjectName("tableWidget_jobs")
+        self.tableWidget_jobs.setColumnCount(0)
+        self.tableWidget_jobs.setRowCount(0)
+        self.verticalLayout.addWidget(self.tableWidget_jobs)
+        self.horizontalLayout_jobs = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_jobs.setObjectName("horizontalLayout_jobs")
+        self.pushButton_pause = QtWidgets.QPushButton(MainWindow)
+        self.pushButton_pause.setEnabled(False)
+        self.pushButton_pause.setObjectName("pushButton_pause")
+        self.horizontalLayout_jobs.addWidget(self.pushButton_pause)
+        self.pushButton_cancel = QtWidgets.QPushButton(MainWindow)
+        self.pushButton_cancel.setEnabled(False)
+        self.pushButton_cancel.setObjectName("pushButton_cancel")
+        self.horizontalLayout_jobs.addWidget(self.pushButton_cancel)
+        self.verticalLayout.addLayout(self.horizontalLayout_jobs)
+        self.label_4 = QtWidgets.QLabel(MainWindow)
+        self.label_4.setObjectName("label_4")
+        self.verticalLayout.addWidget(self.label_4)
+        self.lineEdit_filter = QtWidgets.QLineEdit(MainWindow)
+        self.lineEdit_filter.setClearButtonEnabled(True)
+        self.lineEdit_filter.setObjectName("lineEdit_filter")
+        self.verticalLayout.addWidget(self.lineEdit_filter)
+        self.tableView_results = QtWidgets.QTableView(MainWindow)
+        self.tableView_results.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tableView_results.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.tableView_results.setSortingEnabled(True)
+        self.tableView_results.setWordWrap(False)
+        self.tableView_results.setObjectName("tableView_results")
+        self.verticalLayout.addWidget(self.tableView_results)
+        self.progressBar = QtWidgets.QProgressBar(MainWindow)
+        self.progressBar.setProperty("value", 0)
+        self.progressBar.setVisible(False)
+        self.progressBar.setTextVisible(True)
+        self.progressBar.setObjectName("progressBar")
+        self.verticalLayout.addWidget(self.progressBar)
+        self.label_stats = QtWidgets.QLabel(MainWindow)
+        self.label_stats.setObjectName("label_stats")
+        self.verticalLayout.addWidget(self.label_stats)
+        self.plainTextEdit_stats = QtWidgets.QPlainTextEdit(MainWindow)
+        self.plainTextEdit_stats.setMaximumHeight(120)
+        self.plainTextEdit_stats.setReadOnly(True)
+        self.plainTextEdit_stats.setObjectName("plainTextEdit_stats")
+        self.verticalLayout.addWidget(self.plainTextEdit_stats)
+        self.checkBox_resume = QtWidgets.QCheckBox(MainWindow)
+        self.checkBox_resume.setObjectName("checkBox_resume")
+        self.verticalLayout.addWidget(self.checkBox_resume)
+        self.checkBox_refresh = QtWidgets.QCheckBox(MainWindow)
+        self.checkBox_refresh.setObjectName("checkBox_refresh")
+        self.verticalLayout.addWidget(self.checkBox_refresh)
+        self.pushButton_run = QtWidgets.QPushButton(MainWindow)
+        self.pushButton_run.setEnabled(False)
+        self.pushButton_run.setObjectName("pushButton_run")
+        self.verticalLayout.addWidget(self.pushButton_run)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "BBB.org Business Scraper"))
+        self.label.setText(_translate("MainWindow", "Search Keywords:"))
+        self.label_2.setText(_translate("MainWindow", "State:"))
+        self.label_3.setText(_translate("MainWindow", "Businesses Found:"))
+        self.label_jobs.setText(_translate("MainWindow", "Jobs:"))
+        self.pushButton_pause.setText(_translate("MainWindow", "Pause / Resume"))
+        self.pushButton_cancel.setText(_translate("MainWindow", "Cancel"))
+        self.label_4.setText(_translate("MainWindow", "Results:"))
+        self.lineEdit_filter.setPlaceholderText(_translate("MainWindow", "Filter results..."))
+        self.label_stats.setText(_translate("MainWindow", "Run Stats:"))
+        self.checkBox_resume.setText(_translate("MainWindow", "Resume interrupted run"))
+        self.checkBox_refresh.setText(_translate("MainWindow", "Refresh: only re-scrape changed profiles"))
+        self.pushButton_run.setText(_translate("MainWindow", "Queue Job"))
@@ -0,0 +1,27 @@
+"""GUI-free building blocks of the BBB business scraper.
+
+``Scraper`` runs a whole keyword/location search; ``JobScheduler`` queues
+several of them on a shared browser pool; ``python -m bbb_scraper`` runs a
+file of them in batch. Heavy dependencies (SeleniumBase, bs4,
+requests) are only imported when a run needs them, and so is the engine
+itself: the names below load their module on first access.
+"""
+import importlib
+
+_EXPORTS = {
+    "BusinessProfile": ".profile",
+    "JobScheduler": ".jobs",
+    "RunResult": ".engine",
+    "ScrapeJob": ".jobs",
+    "Scraper": ".engine",
+    "Settings": ".settings",
+    "extract_profile": ".profile",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
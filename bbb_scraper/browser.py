@@ -0,0 +1,187 @@
+"""A bounded pool of long-lived SeleniumBase browsers.
+
+Starting Chrome takes seconds, so sessions are kept open and handed out
+again instead of launching a browser per URL. A session is recycled after
+``max_pages`` page loads or as soon as anything goes wrong while it is
+checked out.
+
+The first browser ever started also downloads and patches the driver.
+``warm_up_driver()`` does that once, ahead of the first job, and leaves a
+stamp so later launches of the app skip it.
+"""
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+
+from .metrics import Metrics
+
+DRIVER_STAMP_PATH = os.path.join(os.path.expanduser("~"), ".bbb_scraper", "driver.json")
+# Chrome updates itself every few weeks; check the driver again after a week
+DRIVER_STAMP_MAX_AGE = 7 * 24 * 3600
+
+# Held while a warm-up launches its browser, so sessions wait for the
+# driver instead of downloading it a second time
+_driver_lock = threading.Lock()
+
+
+def configure_driver_paths():
+    """Force a known location for SeleniumBase drivers. Call before importing seleniumbase."""
+    os.environ["SELENIUMBASE_DRIVER_PATH"] = os.path.join(os.path.expanduser("~"), ".seleniumbase", "drivers")
+    os.environ["SELENIUMBASE_DRIVER_DIR"] = os.path.join(tempfile.gettempdir(), "seleniumbase_drivers")
+
+
+def _seleniumbase_version():
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("seleniumbase")
+    except PackageNotFoundError:
+        return None
+
+
+def driver_ready(stamp_path=DRIVER_STAMP_PATH, max_age=DRIVER_STAMP_MAX_AGE):
+    """True if a recent warm-up with the installed SeleniumBase left its driver in place."""
+    try:
+        with open(stamp_path, encoding="utf-8") as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
+        return False
+    installed = _seleniumbase_version()
+    driver_dir = stamp.get("driver_path") or ""
+    return (installed is not None and stamp.get("seleniumbase") == installed
+            and time.time() - stamp.get("warmed_at", 0) < max_age
+            and os.path.isdir(driver_dir) and bool(os.listdir(driver_dir)))
+
+
+def warm_up_driver(stamp_path=DRIVER_STAMP_PATH, headless=True, metrics=None):
+    """Start and close one browser so the driver is downloaded and checked now, not in the first job.
+
+    Returns False without starting anything while the stamp of an earlier
+    warm-up is still valid (see ``driver_ready``).
+    """
+    metrics = metrics or Metrics()
+    with _driver_lock:
+        if driver_ready(stamp_path):
+            return False
+        configure_driver_paths()
+        from seleniumbase import SB
+
+        with metrics.stage("browser_warmup"):
+            with SB(uc=True, headless=headless):
+                pass
+        directory = os.path.dirname(stamp_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(stamp_path, "w", encoding="utf-8") as f:
+            json.dump({"seleniumbase": _seleniumbase_version(),
+                       "driver_path": os.environ["SELENIUMBASE_DRIVER_PATH"],
+                       "warmed_at": time.time()}, f)
+        return True
+
+
+class BrowserSession:
+    """One running browser, wrapping an entered ``SB(...)`` context."""
+
+    def __init__(self, uc=True, headless=True, metrics=None):
+        configure_driver_paths()
+        from seleniumbase import SB
+
+        self.metrics = metrics or Metrics()
+        self._stack = ExitStack()
+        # Let a warm-up that is still running finish installing the driver
+        with _driver_lock:
+            pass
+        with self.metrics.stage("browser_launch"):
+            self.sb = self._stack.enter_context(SB(uc=uc, headless=headless))
+        self.pages = 0
+
+    def get_page_source(self, url, timeout=30):
+        with self.metrics.stage("page_open"):
+            self.sb.open(url)
+        with self.metrics.stage("page_ready"):
+            self.sb.wait_for_ready_state_complete(timeout)
+        self.pages += 1
+        return self.sb.get_page_source()
+
+    def close(self):
+        try:
+            self._stack.close()
+        except Exception:
+            # The browser may already be gone; nothing left to clean up
+            pass
+
+
+class BrowserPool:
+    """Hands out at most ``size`` browser sessions at a time.
+
+    Sessions are started lazily, reused until they have served ``max_pages``
+    pages, and replaced when released as broken.
+    """
+
+    def __init__(self, size=2, max_pages=50, uc=True, headless=True, metrics=None):
+        if size < 1:
+            raise ValueError("Browser pool size must be at least 1")
+        self.size = size
+        self.max_pages = max_pages
+        self.uc = uc
+        self.headless = headless
+        self.metrics = metrics or Metrics()
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._closed = False
+
+    def acquire(self, timeout=None):
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("No browser session became available")
+        if self._closed:
+            self._slots.release()
+            raise RuntimeError("Browser pool is closed")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return BrowserSession(uc=self.uc, headless=self.headless, metrics=self.metrics)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, session, broken=False):
+        if broken or self._closed or session.pages >= self.max_pages:
+            if broken:
+                self.metrics.count("browser.broken")
+            elif not self._closed:
+                self.metrics.count("browser.recycled")
+            session.close()
+        else:
+            self._idle.put(session)
+        self._slots.release()
+
+    @contextmanager
+    def session(self, timeout=None):
+        """Check a session out for the duration of a ``with`` block."""
+        session = self.acquire(timeout)
+        try:
+            yield session
+        except BaseException:
+            self.release(session, broken=True)
+            raise
+        self.release(session)
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,149 @@
+"""Persistent page cache so re-runs skip the browser and the network.
+
+Pages are stored zlib-compressed in SQLite, keyed by a hash of their URL.
+Each source (BBB search pages, BBB profiles, people-search results, ...) has
+its own time to live, and the least recently used pages are evicted once the
+cache grows past ``max_bytes``.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import Counter
+
+DAY = 24 * 60 * 60
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".bbb_scraper", "pages.sqlite3")
+DEFAULT_TTLS = {
+    "bbb_search": 1 * DAY,
+    "bbb_profile": 7 * DAY,
+    "people_search": 7 * DAY,
+    "person": 30 * DAY,
+}
+
+
+def url_key(url):
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+class PageCache:
+    """Thread-safe SQLite page cache with per-source TTLs and LRU eviction."""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=500 * 1024 * 1024, ttls=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.hits = Counter()
+        self.misses = Counter()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        # Shared by concurrent jobs and other processes: wait out their writes
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                source TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )""")
+        self._db.execute("CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed_at)")
+        # Total size of the pages, kept up to date by every writer in the same
+        # transaction as its change; counted once for caches created before it
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        self._db.execute("INSERT OR IGNORE INTO meta SELECT 'size', COALESCE(SUM(size), 0) FROM pages")
+        self._db.commit()
+        self._size = self._db.execute("SELECT value FROM meta WHERE name = 'size'").fetchone()[0]
+
+    def get(self, url, source):
+        """Return the cached body for ``url``, or None if missing or older than the source's TTL."""
+        key = url_key(url)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT body, fetched_at FROM pages WHERE key = ?", (key,)).fetchone()
+            if row is None or now - row[1] > self.ttls.get(source, DAY):
+                self.misses[source] += 1
+                return None
+            self._db.execute("UPDATE pages SET accessed_at = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self.hits[source] += 1
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def put(self, url, body, source):
+        data = zlib.compress(body.encode("utf-8"))
+        now = time.time()
+        key = url_key(url)
+        with self._lock:
+            # Other processes write to the same file; taking the write lock
+            # first keeps the total exact until the eviction below is done
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                old = self._db.execute("SELECT size FROM pages WHERE key = ?", (key,)).fetchone()
+                self._db.execute(
+                    "INSERT OR REPLACE INTO pages (key, url, source, body, size, fetched_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, url, source, data, len(data), now, now))
+                self._size = self._add_size(len(data) - (old[0] if old else 0))
+                if self._size > self.max_bytes:
+                    self._evict()
+                self._db.commit()
+            except BaseException:
+                self._db.rollback()
+                raise
+
+    def get_or_fetch(self, url, source, fetch, is_valid=None):
+        """Return the cached page, or call ``fetch()`` and cache its result.
+
+        Results rejected by ``is_valid`` (error pages, bot challenges) are
+        returned but not stored.
+        """
+        body = self.get(url, source)
+        if body is None:
+            body = fetch()
+            if is_valid is None or is_valid(body):
+                self.put(url, body, source)
+        return body
+
+    def _evict(self):
+        # Drop least recently used pages until we are back under 90% of the cap
+        target = self.max_bytes * 0.9
+        rows = self._db.execute("SELECT key, size FROM pages ORDER BY accessed_at").fetchall()
+        freed = 0
+        for key, size in rows:
+            if self._size - freed <= target:
+                break
+            self._db.execute("DELETE FROM pages WHERE key = ?", (key,))
+            freed += size
+        self._size = self._add_size(-freed)
+
+    def _add_size(self, delta):
+        self._db.execute("UPDATE meta SET value = value + ? WHERE name = 'size'", (delta,))
+        return self._db.execute("SELECT value FROM meta WHERE name = 'size'").fetchone()[0]
+
+    def stats(self):
+        """Hit/miss counts per source, plus the current size in bytes."""
+        sources = sorted(set(self.hits) | set(self.misses))
+        return {
+            "size_bytes": self._size,
+            "sources": {source: {"hits": self.hits[source], "misses": self.misses[source]} for source in sources},
+        }
+
+    def summary(self):
+        hits, misses = sum(self.hits.values()), sum(self.misses.values())
+        return f"Page cache: {hits} hits, {misses} misses, {self._size / (1024 * 1024):.1f} MB"
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM pages")
+            self._db.execute("UPDATE meta SET value = 0 WHERE name = 'size'")
+            self._db.commit()
+            self._size = 0
+
+    def close(self):
+        with self._lock:
+            self._db.close()
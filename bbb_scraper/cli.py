@@ -0,0 +1,180 @@
+"""Batch command line entry point: run many keyword/location jobs without the GUI.
+
+    python -m bbb_scraper jobs.csv --processes 4 --output-dir out/
+
+The jobs file has one ``keywords,location`` pair per line (an optional third
+column names the output file; its extension picks CSV, SQLite or Parquet). Blank lines and lines starting with ``#`` are
+ignored. Every job runs in its own process with its own browser pool.
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from .engine import Scraper, Settings
+from .jobs import default_output_path
+from .metrics import PROFILERS
+
+FORMATS = {"csv": ".csv", "sqlite": ".sqlite3", "parquet": ".parquet"}
+
+
+@dataclass
+class Job:
+    keywords: str
+    location: str
+    output_path: str
+
+
+def read_jobs(path, output_dir=".", extension=".csv"):
+    jobs = []
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.reader(f):
+            if not row or not row[0].strip() or row[0].lstrip().startswith('#'):
+                continue
+            if len(row) < 2:
+                raise ValueError(f"Job line needs keywords and a location: {','.join(row)}")
+            keywords, location = row[0].strip(), row[1].strip()
+            if (keywords.lower(), location.lower()) == ("keywords", "location"):
+                continue
+            if len(row) > 2 and row[2].strip():
+                output_path = os.path.join(output_dir, row[2].strip())
+            else:
+                output_path = default_output_path(keywords, location, output_dir, extension)
+            jobs.append(Job(keywords, location, output_path))
+    return jobs
+
+
+@dataclass
+class Options:
+    scrapedo_key: str
+    settings: Settings
+    resume: bool = False
+    cache_path: Optional[str] = None
+    # Write a JSON-lines trace next to each job's CSV
+    trace: bool = False
+    # Skip businesses and owners already claimed in this index
+    seen_index_path: Optional[str] = None
+    # Seconds after which a business or owner in the index is scraped again
+    seen_max_age: Optional[float] = None
+    # Refresh run: reuse the rows of profiles unchanged since the last run
+    fingerprints_path: Optional[str] = None
+
+
+def run_job(job, options):
+    """Run a single job; executed in a worker process."""
+    page_cache = None
+    if options.cache_path:
+        from .cache import PageCache
+        page_cache = PageCache(options.cache_path)
+    seen_index = None
+    if options.seen_index_path:
+        from .dedup import SeenIndex
+        seen_index = SeenIndex(options.seen_index_path, max_age=options.seen_max_age)
+    fingerprints = None
+    if options.fingerprints_path:
+        from .fingerprint import FingerprintStore
+        fingerprints = FingerprintStore(options.fingerprints_path)
+    settings = options.settings
+    if options.trace:
+        settings = replace(settings, trace_path=job.output_path + ".trace.jsonl")
+    scraper = Scraper(options.scrapedo_key, settings, page_cache=page_cache, seen_index=seen_index,
+                      fingerprints=fingerprints)
+    tag = f"[{job.keywords} / {job.location}]"
+    try:
+        return scraper.run(job.keywords, job.location, job.output_path, options.resume,
+                           on_status=lambda message: print(f"{tag} {message}", flush=True))
+    finally:
+        if page_cache is not None:
+            page_cache.close()
+        if seen_index is not None:
+            seen_index.close()
+        if fingerprints is not None:
+            fingerprints.close()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m bbb_scraper", description="Run BBB scraping jobs in batch.")
+    parser.add_argument("jobs", help="CSV file with one 'keywords,location[,output.csv]' job per line")
+    parser.add_argument("--output-dir", default=".", help="directory for the per-job output files")
+    parser.add_argument("--format", choices=sorted(FORMATS), default="csv",
+                        help="output format for jobs that do not name their output file "
+                             "(sqlite and parquet keep every phone and email; parquet needs pyarrow)")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="jobs run at once, one process each (default: CPU count)")
+    parser.add_argument("--resume", action="store_true", help="resume each job from its run journal")
+    parser.add_argument("--limit", type=int, default=None, help="stop each job after this many businesses")
+    parser.add_argument("--browsers", type=int, default=Settings.browser_pool_size,
+                        help="browser sessions per job")
+    parser.add_argument("--concurrency", type=int, default=Settings.business_concurrency,
+                        help="businesses processed at once per job")
+    parser.add_argument("--token", default=os.environ.get("SCRAPEDO_API_KEY", ""),
+                        help="scrape.do API token (default: $SCRAPEDO_API_KEY)")
+    parser.add_argument("--cache", default=None,
+                        help="page cache database (default: ~/.bbb_scraper/pages.sqlite3)")
+    parser.add_argument("--no-cache", action="store_true", help="always fetch live pages")
+    parser.add_argument("--skip-seen", action="store_true",
+                        help="skip businesses and owners scraped by earlier runs or other jobs")
+    parser.add_argument("--seen-index", default=None,
+                        help="index used by --skip-seen (default: ~/.bbb_scraper/seen.sqlite3)")
+    parser.add_argument("--seen-max-age", type=float, default=None, metavar="DAYS",
+                        help="with --skip-seen, scrape businesses and owners again once their entry is this old "
+                             "(default: never)")
+    parser.add_argument("--refresh", action="store_true",
+                        help="only re-scrape profiles that changed since the last run of each job, "
+                             "and write the new/changed/removed businesses to <output>.diff.csv")
+    parser.add_argument("--fingerprints", default=None,
+                        help="profile fingerprints used by --refresh (default: ~/.bbb_scraper/fingerprints.sqlite3)")
+    parser.add_argument("--trace", action="store_true",
+                        help="write per-stage timings to <output>.trace.jsonl for each job")
+    parser.add_argument("--profile", choices=sorted(PROFILERS), default=None,
+                        help="profile each job; the report is saved next to its CSV")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    jobs = read_jobs(args.jobs, args.output_dir, FORMATS[args.format])
+    if not jobs:
+        print("No jobs to run", file=sys.stderr)
+        return 1
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    cache_path = None
+    if not args.no_cache:
+        from .cache import DEFAULT_CACHE_PATH
+        cache_path = args.cache or DEFAULT_CACHE_PATH
+    settings = replace(Settings(), browser_pool_size=args.browsers, business_concurrency=args.concurrency,
+                       max_businesses=args.limit, profiler=args.profile)
+    seen_index_path = None
+    if args.skip_seen:
+        from .dedup import DEFAULT_INDEX_PATH
+        seen_index_path = args.seen_index or DEFAULT_INDEX_PATH
+    fingerprints_path = None
+    if args.refresh:
+        from .fingerprint import DEFAULT_FINGERPRINT_PATH
+        fingerprints_path = args.fingerprints or DEFAULT_FINGERPRINT_PATH
+    seen_max_age = args.seen_max_age * 24 * 3600 if args.seen_max_age is not None else None
+    options = Options(args.token, settings, args.resume, cache_path, args.trace, seen_index_path,
+                      seen_max_age=seen_max_age, fingerprints_path=fingerprints_path)
+
+    processes = min(len(jobs), args.processes or os.cpu_count() or 1)
+    start = time.perf_counter()
+    failed = 0
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = {executor.submit(run_job, job, options): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"FAILED {job.keywords} / {job.location}: {e}", file=sys.stderr, flush=True)
+                continue
+            print(f"DONE {job.keywords} / {job.location}: {result.discovered} businesses, "
+                  f"{result.saved} rows -> {job.output_path}", flush=True)
+    print(f"{len(jobs) - failed}/{len(jobs)} jobs finished in {time.perf_counter() - start:.1f}s")
+    return 1 if failed else 0
@@ -0,0 +1,145 @@
+"""Cross-run index of businesses and contacts that have already been scraped.
+
+Overlapping searches ("plumbing" / "plumber", neighboring cities) list many
+of the same businesses. ``SeenIndex`` remembers canonical profile URLs and
+normalized owner names in SQLite, so a later run (or another job running at
+the same time) skips them before spending browser or API time on them.
+
+Entries are *claimed*: the first run to insert one owns it, every other
+run sees it as already taken. A claim is in progress until the run marks
+it complete; a run that fails to finish a business (or is cancelled)
+releases its claim so the next run retries it, and an in-progress claim
+left behind by a killed process can be taken again once its lease runs
+out.
+"""
+import os
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".bbb_scraper", "seen.sqlite3")
+
+# Profile sub-pages and location variants that show the same business
+_PROFILE_SUFFIX = re.compile(r"/(addressId/\d+|customer-reviews|complaints|details)$", re.IGNORECASE)
+_PUNCTUATION = re.compile(r"[^\w\s-]")
+
+
+def canonical_business_url(url):
+    """``https://www.bbb.org/us/nv/x/profile/y/name-123/addressId/4?tab=1`` -> ``https://www.bbb.org/us/nv/x/profile/y/name-123``."""
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/")
+    while True:
+        shorter = _PROFILE_SUFFIX.sub("", path).rstrip("/")
+        if shorter == path:
+            break
+        path = shorter
+    return urlunsplit((parts.scheme.lower() or "https", parts.netloc.lower(), path.lower(), "", ""))
+
+
+def normalize_contact(name):
+    """Lower-case a name already passed through ``Scraper.clean_text`` and drop punctuation."""
+    return " ".join(_PUNCTUATION.sub(" ", name).lower().split())
+
+
+class SeenIndex:
+    """SQLite set of claimed business URLs and (contact name, ZIP) pairs, shared between processes.
+
+    With ``max_age`` (seconds), a completed claim older than that can be
+    taken again, so businesses get refreshed eventually. A claim that was
+    never completed can be taken again after ``lease`` seconds.
+    """
+
+    def __init__(self, path=DEFAULT_INDEX_PATH, max_age=None, lease=3600.0):
+        self.path = path
+        self.max_age = max_age
+        self.lease = lease
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Several job processes may claim at once; wait for each other's writes
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS businesses (url TEXT PRIMARY KEY, claimed_at REAL, "
+                         "done INTEGER NOT NULL DEFAULT 0)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS contacts (name TEXT, zip TEXT, claimed_at REAL, "
+                         "done INTEGER NOT NULL DEFAULT 0, PRIMARY KEY (name, zip))")
+        for table in ("businesses", "contacts"):
+            columns = [row[1] for row in self._db.execute(f"PRAGMA table_info({table})")]
+            if "done" not in columns:
+                # Indexes from before claims could be in progress hold finished work only
+                self._db.execute(f"ALTER TABLE {table} ADD COLUMN done INTEGER NOT NULL DEFAULT 1")
+        self._lock = threading.Lock()
+
+    def _claim(self, table, key_columns, keys):
+        now = time.time()
+        # Completed claims expire after max_age (never without one), unfinished ones after the lease
+        stale = now - self.max_age if self.max_age is not None else float("-inf")
+        abandoned = now - self.lease
+        where = " AND ".join(f"{column} = ?" for column in key_columns)
+        claimed = []
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                for key in keys:
+                    cursor = self._db.execute(
+                        f"INSERT OR IGNORE INTO {table} ({', '.join(key_columns)}, claimed_at, done) "
+                        f"VALUES ({', '.join('?' * (len(key_columns) + 1))}, 0)", (*key, now))
+                    if cursor.rowcount == 0:
+                        cursor = self._db.execute(
+                            f"UPDATE {table} SET claimed_at = ?, done = 0 WHERE {where} "
+                            f"AND claimed_at < (CASE done WHEN 1 THEN ? ELSE ? END)",
+                            (now, *key, stale, abandoned))
+                    claimed.append(cursor.rowcount == 1)
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return claimed
+
+    def claim_businesses(self, urls):
+        """The URLs of ``urls`` not claimed before, now claimed; URLs that canonicalize alike count once."""
+        canonical = [canonical_business_url(url) for url in urls]
+        claimed = self._claim("businesses", ("url",), [(url,) for url in canonical])
+        return [url for url, ok in zip(urls, claimed) if ok]
+
+    def complete_business(self, url):
+        """Mark a claimed business as scraped; only ``max_age`` makes it available again."""
+        with self._lock:
+            self._db.execute("UPDATE businesses SET done = 1, claimed_at = ? WHERE url = ?",
+                             (time.time(), canonical_business_url(url)))
+
+    def release_business(self, url):
+        with self._lock:
+            self._db.execute("DELETE FROM businesses WHERE url = ? AND done = 0", (canonical_business_url(url),))
+
+    def claim_contact(self, name, zip_code):
+        """True if the contact was not claimed before (and is now)."""
+        return self._claim("contacts", ("name", "zip"), [(normalize_contact(name), zip_code or "")])[0]
+
+    def complete_contact(self, name, zip_code):
+        with self._lock:
+            self._db.execute("UPDATE contacts SET done = 1, claimed_at = ? WHERE name = ? AND zip = ?",
+                             (time.time(), normalize_contact(name), zip_code or ""))
+
+    def release_contact(self, name, zip_code):
+        with self._lock:
+            self._db.execute("DELETE FROM contacts WHERE name = ? AND zip = ? AND done = 0",
+                             (normalize_contact(name), zip_code or ""))
+
+    def stats(self):
+        with self._lock:
+            businesses = self._db.execute("SELECT COUNT(*) FROM businesses").fetchone()[0]
+            contacts = self._db.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+        return {"businesses": businesses, "contacts": contacts}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
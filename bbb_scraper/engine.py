@@ -0,0 +1,550 @@
+"""GUI-free scraping engine: from a keyword/location search to a CSV of people.
+
+Nothing heavy is imported at module level. BeautifulSoup, requests and
+SeleniumBase are imported the first time they are needed, so importing the
+engine (or starting the CLI) stays fast.
+"""
+import asyncio
+import functools
+import itertools
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from dataclasses import dataclass
+
+from .browser import BrowserPool, configure_driver_paths
+from .fetch import PROFILE_MARKERS, SEARCH_MARKERS, PageFetcher
+from .fingerprint import ProfileRefresh, search_key
+from .journal import RunJournal, journal_path
+from .llm import OwnerExtractor
+from .metrics import PROFILERS, Metrics, profiled
+from .output import open_sink
+from .pipeline import IncompleteRows, Pipeline
+from .profile import extract_profile
+from .ratelimit import RateLimiter
+from .records import PersonRecord
+from .settings import Settings
+from .text import clean_name, find_emails, split_contact, split_contacts
+from .transport import Transport
+
+POSSIBLE_TITLES = ["owner", "president", "ceo", "founder"]
+
+
+def fetch_bbb_page(url, pool=None, cache=None, fetcher=None):
+    if cache is not None:
+        # Only keep real profile pages, never a bot check or an error page
+        return cache.get_or_fetch(url, "bbb_profile", lambda: fetch_bbb_page(url, pool, fetcher=fetcher),
+                                  is_valid=lambda html: 'id="businessName"' in html)
+    if fetcher is not None:
+        return fetcher.fetch(url, PROFILE_MARKERS)
+    if pool is not None:
+        with pool.session() as session:
+            return session.get_page_source(url)
+    configure_driver_paths()
+    from seleniumbase import SB
+
+    with SB(uc=True, headless=True) as sb:
+        sb.open(url)
+        sb.wait_for_ready_state_complete(30)
+        content = sb.get_page_source()
+        return content
+
+
+def parse_owner_title_from_html(html):
+    return extract_profile(html).owner_title()
+
+
+def get_address(html):
+    return extract_profile(html).address
+
+
+def get_business_name(html):
+    return extract_profile(html).name
+
+
+def get_start_year(html):
+    return extract_profile(html).start_date
+
+
+async def crawl_bbb_business(url, pool=None, executor=None, metrics=None):
+    metrics = metrics or Metrics()
+    # The browser blocks, so it runs on an executor thread while the loop
+    # keeps other businesses moving
+    loop = asyncio.get_running_loop()
+    with metrics.stage("fetch_profile"):
+        html = await loop.run_in_executor(executor, fetch_bbb_page, url, pool)
+    # One parse for every field instead of one per extractor
+    with metrics.stage("parse_profile"):
+        profile = extract_profile(html)
+    return html, profile
+
+
+@dataclass
+class RunResult:
+    discovered: int
+    saved: int
+
+
+def _ignore(*args):
+    pass
+
+
+class Scraper:
+    """Finds businesses on BBB, their owners, and the owners' contact details."""
+
+    # Endpoints; override them on an instance to point at another server
+    # (the offline benchmarks use a local fake)
+    bbb_base_url = "https://www.bbb.org"
+    scrapedo_api_url = "http://api.scrape.do"
+    llm_chat_url = "http://localhost:11434/api/chat"
+
+    def __init__(self, scrapedo_key, settings=None, page_cache=None, seen_index=None, fingerprints=None,
+                 transport=None, llm=None, search_limiter=None):
+        self.scrapedo_key = scrapedo_key
+        self.settings = settings or Settings()
+        # Pages fetched in earlier runs are reused until their TTL runs out
+        self.page_cache = page_cache
+        # With a bbb_scraper.dedup.SeenIndex, businesses and owners scraped by
+        # earlier runs (or other jobs sharing the index) are skipped
+        self.seen_index = seen_index
+        # With a bbb_scraper.fingerprint.FingerprintStore, runs are refreshes:
+        # unchanged profiles reuse the rows of the previous run
+        self.fingerprints = fingerprints
+        # Replaced at the start of every run(); safe to read from other threads
+        self.metrics = Metrics()
+        # A Transport, OwnerExtractor and search-page RateLimiter passed in
+        # are shared with other scrapers (see bbb_scraper.jobs), so their
+        # per-host limits hold for all of them together
+        self._llm = llm
+        self._transport = transport
+        self.search_limiter = search_limiter
+
+    @property
+    def transport(self):
+        """The pooled, rate limited ``Transport`` shared by every outbound request."""
+        if self._transport is None:
+            self._transport = Transport(timeout=self.settings.http_timeout, retries=self.settings.http_retries,
+                                        pool_size=max(self.settings.http_concurrency, self.settings.llm_concurrency),
+                                        metrics=self.metrics)
+        if self._transport.metrics is not self.metrics:
+            self._transport = self._transport.with_metrics(self.metrics)
+        return self._transport
+
+    @property
+    def llm(self):
+        """The ``OwnerExtractor`` behind ``get_owner_by_llm``; its memo lives as long as the scraper (or the shared extractor)."""
+        if self._llm is None or self._llm.url != self.llm_chat_url:
+            self._llm = OwnerExtractor(self.llm_chat_url, concurrency=self.settings.llm_concurrency,
+                                       batch_size=self.settings.llm_batch_size, transport=self.transport,
+                                       metrics=self.metrics)
+        if self._llm.metrics is not self.metrics:
+            self._llm = self._llm.with_metrics(self.metrics)
+        return self._llm
+
+    def run(self, search_keywords, state, output_path='people.csv', resume=False,
+            on_status=_ignore, on_row=_ignore, on_progress=_ignore, pool=None, browser_executor=None,
+            checkpoint=None):
+        """Scrape one search into ``output_path``, blocking until it is done.
+
+        Pass ``pool`` and ``browser_executor`` to share browsers with other
+        runs (see ``bbb_scraper.jobs``); otherwise the run starts its own.
+        """
+        settings = self.settings
+        self.metrics = Metrics(settings.trace_path)
+        profile_path = settings.profile_path
+        if settings.profiler and not profile_path:
+            profile_path = output_path + PROFILERS.get(settings.profiler, "")
+        try:
+            with ExitStack() as stack:
+                if pool is None:
+                    # Browsers are started once per run and shared by every
+                    # page load. The executor has one thread per browser, so a
+                    # page load only ever waits for a free browser, never for a
+                    # thread.
+                    pool = stack.enter_context(BrowserPool(
+                        size=settings.browser_pool_size, max_pages=settings.pages_per_browser,
+                        headless=settings.headless, metrics=self.metrics))
+                    browser_executor = stack.enter_context(ThreadPoolExecutor(
+                        max_workers=settings.browser_pool_size, thread_name_prefix="browser"))
+                stack.enter_context(profiled(settings.profiler, profile_path))
+                return asyncio.run(self.run_async(search_keywords, state, pool, browser_executor, output_path,
+                                                  resume, on_status, on_row, on_progress, checkpoint))
+        finally:
+            self.metrics.close()
+
+    async def run_async(self, search_keywords, state, pool, browser_executor, output_path='people.csv',
+                        resume=False, on_status=_ignore, on_row=_ignore, on_progress=_ignore, checkpoint=None):
+        on_status("Getting business URLs...")
+        journal = self.open_journal(search_keywords, state, output_path, resume, on_status)
+        http_limit = asyncio.Semaphore(self.settings.http_concurrency)
+        fetcher = PageFetcher(pool, self.transport, http=self.settings.http_fast_path, metrics=self.metrics)
+        refresh = None
+        fetch_page = functools.partial(fetch_bbb_page, pool=pool, cache=self.page_cache, fetcher=fetcher)
+        if self.fingerprints is not None:
+            search = search_key(search_keywords, state)
+            run = self.fingerprints.start_run(search, resume=journal.resumed)
+            refresh = ProfileRefresh(self.fingerprints, search, run, fetcher, self.page_cache, self.metrics)
+            # Conditional requests instead of the page cache, which would hide changes
+            fetch_page = refresh.fetch
+        # The output's extension picks the sink: .csv, .sqlite3/.db or .parquet
+        with journal, open_sink(output_path, append=journal.resumed) as sink:
+            pipeline = Pipeline(
+                discover=lambda: self.iter_urls(search_keywords, state, pool, rate_limiter=self.search_limiter,
+                                                fetcher=fetcher),
+                fetch_page=fetch_page,
+                enrich=lambda profile: self.enrich_profile(profile, self.scrapedo_key, http_limit),
+                sink=sink,
+                fetch_executor=browser_executor,
+                fetchers=pool.size,
+                extractors=self.settings.business_concurrency,
+                limit=self.settings.max_businesses,
+                journal=journal,
+                on_status=on_status,
+                on_row=on_row,
+                on_progress=on_progress,
+                metrics=self.metrics,
+                claim=self.claim_business if self.seen_index is not None else None,
+                on_failed=self.seen_index.release_business if self.seen_index is not None else _ignore,
+                on_done=self.seen_index.complete_business if self.seen_index is not None else _ignore,
+                checkpoint=checkpoint,
+                refresh=refresh,
+            )
+            saved = await pipeline.run()
+            journal.record_finished()
+
+        if not pipeline.discovered and not pipeline.skipped:
+            on_status("No business URLs found")
+        elif saved:
+            on_status(f"Completed! Saved {saved} records to {output_path}")
+        else:
+            on_status("No data to save")
+        if pipeline.skipped:
+            on_status(f"Skipped {pipeline.skipped} businesses already scraped by earlier runs")
+        if refresh is not None:
+            # Without every business of the search, missing ones are not "removed"
+            diff = refresh.finish(complete=self.settings.max_businesses is None and not pipeline.skipped)
+            diff_path = output_path + ".diff.csv"
+            diff.write_csv(diff_path)
+            on_status(f"{diff.summary()}; details in {diff_path}")
+        if self.page_cache is not None:
+            on_status(self.page_cache.summary())
+        on_status(fetcher.summary())
+        on_status(self.metrics.summary())
+        return RunResult(discovered=pipeline.discovered, saved=saved)
+
+    def open_journal(self, search_keywords, state, output_path, resume=False, on_status=_ignore):
+        """Start a new run journal, or pick up the last one when resuming."""
+        path = journal_path(output_path)
+        if resume and RunJournal.exists(path):
+            journal = RunJournal.resume(path)
+            on_status(f"Resuming last run: {len(journal.done)} businesses done, "
+                      f"{len(journal.pending)} pending, {journal.rows} rows saved")
+            return journal
+        return RunJournal.start(path, {"search_keywords": search_keywords, "state": state,
+                                       "output_path": output_path})
+
+    def claim_business(self, url):
+        return self.seen_index.claim_businesses([url]) != []
+
+    def clean_text(self, text_to_clean):
+        # Remove honorifics & extra whitespace
+        return clean_name(text_to_clean)
+
+    def extract_emails(self, soup):
+        # The person card holds the addresses; the rest of the page only adds
+        # site contacts and footer text
+        return find_emails(soup.find("div", id="personDetails") or soup)
+
+    def get_business_urls(self, html):
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, 'html.parser')
+        raw_urls = soup.find_all('a', class_='text-blue-medium')
+        if raw_urls:
+            urls = [self.bbb_base_url + url.get('href') for url in raw_urls]
+            return urls
+        return []
+
+    def get_result_count(self, html):
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, 'html.parser')
+        raw_pag = soup.find('h1', class_='search-results-heading').get_text(" ", strip=True)
+        return int(raw_pag.split()[1])
+
+    def cached(self, url, source, fetch, is_valid=None):
+        """Serve ``url`` from the page cache when possible, otherwise ``fetch()`` it."""
+        if self.page_cache is None:
+            return fetch()
+        return self.page_cache.get_or_fetch(url, source, fetch, is_valid)
+
+    def search_url(self, search_keywords: str, state: str, page: int):
+        keywords = '+'.join(search_keywords.split())
+        state_keyword = '%20'.join(state.split())
+        return f"{self.bbb_base_url}/search?find_country=USA&find_latlng=36.142467%2C-115.204160&find_loc={state_keyword}&find_text={keywords}&page={page}&touched=1"
+
+    def get_urls(self, search_keywords: str, state: str = "Las Vegas", pool=None):
+        urls = []
+        for page_urls in self.iter_urls(search_keywords, state, pool):
+            urls.extend(page_urls)
+        if self.seen_index is not None:
+            # The caller is expected to fetch every URL returned and mark it
+            # with seen_index.complete_business (unfinished claims lapse after the lease)
+            urls = self.seen_index.claim_businesses(urls)
+        return urls
+
+    def iter_urls(self, search_keywords: str, state: str = "Las Vegas", pool=None, concurrency=None,
+                  rate_limiter=None, fetcher=None):
+        """Yield the business URLs of each search results page as soon as it is parsed.
+
+        Page 1 tells us how many pages there are; the rest are loaded in
+        parallel on up to ``concurrency`` pooled browsers (default: the pool
+        size), with page loads spaced out by ``rate_limiter``. A ``fetcher``
+        tries each page over plain HTTP before using a browser. At most
+        ``concurrency`` pages are loading or waiting to be read at a time; the
+        next one starts as the caller takes a page.
+        """
+        if pool is None:
+            # Search results were always loaded in a visible browser
+            with BrowserPool(size=1, headless=False) as own_pool:
+                yield from self.iter_urls(search_keywords, state, own_pool, concurrency, rate_limiter)
+            return
+        if rate_limiter is None:
+            rate_limiter = RateLimiter(self.settings.search_pages_per_second, burst=pool.size)
+
+        def browse(url):
+            rate_limiter.acquire()
+            if fetcher is not None:
+                return fetcher.fetch(url, SEARCH_MARKERS)
+            with pool.session() as session:
+                return session.get_page_source(url)
+
+        def load_page(page):
+            url = self.search_url(search_keywords, state, page)
+            html = self.cached(url, "bbb_search", lambda: browse(url),
+                               is_valid=lambda html: 'search-results-heading' in html)
+            return html
+
+        def parse_page(html):
+            with self.metrics.stage("parse_search"):
+                return self.get_business_urls(html)
+
+        html = load_page(1)
+        pagination = self.get_result_count(html) // 15 + 2
+        yield parse_page(html)
+
+        workers = concurrency or pool.size
+        pages = iter(range(2, pagination))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="search")
+        try:
+            pending = {executor.submit(load_page, pag) for pag in itertools.islice(pages, workers)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield parse_page(future.result())
+                    # A page was read; only now start the next one
+                    pag = next(pages, None)
+                    if pag is not None:
+                        pending.add(executor.submit(load_page, pag))
+        finally:
+            # Stop loading pages nobody will read if the caller stops early
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_ok_text(self, url):
+        response = self.transport.get(url)
+        # Raising keeps failed responses out of the page cache
+        response.raise_for_status()
+        return response.text
+
+    def get_people_urls(self, fullname: str, zipcode: str, token: str):
+        from bs4 import BeautifulSoup
+
+        fullname = '-'.join(fullname.split()).lower()
+
+        # Scrape.do API endpoint - enabling "super=true" and "geoCode=us" for US-based residential proxies
+        api_url = f"{self.scrapedo_api_url}?url=https%3A%2F%2Fwww.truepeoplesearch.com%2Fresults%3Fname%3D{fullname}%26citystatezip%3D{zipcode}&token={token}&super=true&geoCode=us"
+        # Send the request and parse HTML. The cache key leaves the token out.
+        html = self.cached(f"https://www.truepeoplesearch.com/results?name={fullname}&citystatezip={zipcode}",
+                           "people_search", lambda: self.get_ok_text(api_url),
+                           is_valid=lambda html: 'id="search-results"' in html)
+        soup = BeautifulSoup(html, "html.parser")
+
+        raw_urls = soup.find_all('a', {"aria-label": "View All Details"})
+        urls = list(set(["https://www.truepeoplesearch.com" + url.get('href') for url in raw_urls]))
+
+        return urls
+
+    def get_person_details(self, person_id: str, token: str, bname: str, start_date, position: str):
+        from bs4 import BeautifulSoup
+
+        try:
+            url_to_get = f"{self.scrapedo_api_url}?url=https://www.truepeoplesearch.com/find/person/{person_id}&token={token}&super=true&geoCode=us"
+            html = self.cached(f"https://www.truepeoplesearch.com/find/person/{person_id}", "person",
+                               lambda: self.get_ok_text(url_to_get),
+                               is_valid=lambda html: 'id="personDetails"' in html)
+            soup = BeautifulSoup(html, "html.parser")
+            person = soup.find("div", id="personDetails")
+            # name = f"{person['data-fn']} {person['data-ln']}"
+            name = soup.find('h1', class_='oh1').text
+            age = person["data-age"]
+            addr = soup.find("a", {"data-link-to-more": "address"})
+            address = addr.find("span", {"itemprop": "streetAddress"}).text.strip()
+            city = addr.find("span", {"itemprop": "addressLocality"}).text.strip()
+            state = addr.find("span", {"itemprop": "addressRegion"}).text.strip()
+
+            # Extract phone number
+            phone = soup.find("a", {"data-link-to-more": "phone"}).find_all("span", itemprop="telephone")
+            phones = [phon.text.strip() for phon in phone]
+            emails = find_emails(person)
+            if "support@truepeoplesearch.com" in emails:
+                emails.remove("support@truepeoplesearch.com")
+
+            record = PersonRecord(name=name, age=age, position=position, address=address, city=city,
+                                  state=state, business_name=bname, business_start_date=start_date,
+                                  phones=phones, emails=emails)
+        except Exception as e:
+            # A lookup that fails or a page without the expected fields loses one person, not the run
+            self.metrics.count("person_details.error", error=type(e).__name__)
+            return None
+
+        return record
+
+    def get_owner_by_llm(self, profile_text):
+        """Ask the local LLM for the owner in ``profile_text``; ``{"owner0": ..., "title": ...}``."""
+        return self.llm.extract(profile_text)
+
+    async def run_demo(self, bbb_url, scrapedo_key, pool=None, executor=None, http_limit=None):
+        try:
+            # Step 1: Crawl BBB business page
+            html, profile = await crawl_bbb_business(bbb_url, pool, executor, self.metrics)
+            # Step 2: Look the owners up and collect their details
+            return await self.enrich_profile(profile, scrapedo_key, http_limit)
+        except Exception as e:
+            self.metrics.count("business.error", stage="run_demo")
+            print(e)
+            print("no available information")
+            return []
+
+    async def enrich_profile(self, profile, scrapedo_key, http_limit=None):
+        """Find the people behind a parsed BBB profile and return one row per person.
+
+        If the LLM, a people search or a details lookup failed, the rows come
+        back as ``IncompleteRows`` so a refresh does not store them as final.
+        """
+        # Outbound HTTP is blocking ``requests``; run it on threads, at most
+        # ``http_limit`` calls at a time, so lookups for one business overlap
+        if http_limit is None:
+            http_limit = asyncio.Semaphore(self.settings.http_concurrency)
+
+        async def call(func, *args):
+            async with http_limit:
+                return await asyncio.to_thread(func, *args)
+
+        bname, start_date = profile.name, profile.start_date
+        zip_code = profile.address.split()[-1].split('-')[0]
+        owner_title = profile.owner_title()
+        if not owner_title:
+            # Bounded by Settings.llm_concurrency rather than http_limit
+            owner_title = await self.llm.extract_async(profile.page_text)
+        # Whether any lookup for this business failed
+        failed = owner_title is None
+
+        owners = []
+        if owner_title:
+            for i in range(len(owner_title.keys())):
+                full_owner_info = owner_title.get(f'owner{i}', "")
+                if full_owner_info not in owners:
+                    owners.append(full_owner_info)
+
+        if self.seen_index is not None:
+            owners = await self.unseen_owners(owners, zip_code)
+
+        # (name, title) per owner, split and cleaned once
+        contacts = split_contacts(owners)
+        try:
+            lookups = await asyncio.gather(
+                *(call(self.get_people_urls, name, zip_code, scrapedo_key) for name, _ in contacts),
+                return_exceptions=True)
+            people_urls = []
+            for (name, position), urls in zip(contacts, lookups):
+                if isinstance(urls, BaseException):
+                    failed = True
+                    self.metrics.count("people_search.error", error=type(urls).__name__)
+                    if self.seen_index is not None:
+                        # Let a later run look this person up again
+                        self.seen_index.release_contact(name, zip_code)
+                else:
+                    people_urls.append((name, position, urls))
+
+            details = []
+            # Contact name of each details lookup
+            looked_up = []
+            for name, position, urls in people_urls:
+                for url in urls:
+                    pid = url.split('/')[-1]
+                    details.append(call(self.get_person_details, pid, scrapedo_key, bname, start_date, position))
+                    looked_up.append(name)
+
+            results = await asyncio.gather(*details, return_exceptions=True)
+        except BaseException:
+            if self.seen_index is not None:
+                # Cancelled or failed part-way: nothing was stored for these
+                for name, _ in contacts:
+                    if name:
+                        self.seen_index.release_contact(name, zip_code)
+            raise
+
+        found = set()
+        for name, result in zip(looked_up, results):
+            if isinstance(result, BaseException):
+                self.metrics.count("person_details.error", error=type(result).__name__)
+            if result and not isinstance(result, BaseException):
+                found.add(name)
+            else:
+                failed = True
+        if self.seen_index is not None:
+            for name, _, urls in people_urls:
+                if not name:
+                    continue
+                if urls and name not in found:
+                    # Every details lookup failed; a later run may have more luck
+                    self.seen_index.release_contact(name, zip_code)
+                else:
+                    self.seen_index.complete_contact(name, zip_code)
+        rows = [result for result in results if result and not isinstance(result, BaseException)]
+        return IncompleteRows(rows) if failed else rows
+
+    async def unseen_owners(self, owners, zip_code):
+        """The owners whose cleaned name and ZIP no earlier business or run has looked up."""
+        names = [split_contact(owner)[0] for owner in owners]
+        # Whether each owner's contact was claimed by this call
+        claimed = [False] * len(names)
+        lock = threading.Lock()
+        cancelled = False
+
+        def claim():
+            for i, name in enumerate(names):
+                with lock:
+                    if cancelled:
+                        return
+                    claimed[i] = bool(name) and self.seen_index.claim_contact(name, zip_code)
+
+        try:
+            await asyncio.to_thread(claim)
+        except BaseException:
+            # The claiming thread outlives a cancel; stop it and hand back
+            # what it took so far
+            with lock:
+                cancelled = True
+            for name, taken in zip(names, claimed):
+                if taken:
+                    self.seen_index.release_contact(name, zip_code)
+            raise
+
+        fresh = []
+        for owner, name, taken in zip(owners, names, claimed):
+            if not name or taken:
+                fresh.append(owner)
+            else:
+                self.metrics.count("dedup.contact_skipped")
+        return fresh
@@ -0,0 +1,116 @@
+"""Load BBB pages with a plain HTTP GET when that is enough, and a browser when it is not.
+
+Search listings and profiles are server-rendered: the markup the parsers
+read is in the first response, no JavaScript needed. A pooled GET costs a
+fraction of a browser page load, so ``PageFetcher`` tries it first and
+only falls back to the browser pool when the markers the parsers rely on
+are missing (a bot check, an error page, a changed layout).
+"""
+import threading
+
+from .metrics import Metrics
+
+PROFILE_MARKERS = ('id="businessName"', "bpr-overview-address")
+SEARCH_MARKERS = ("search-results-heading", "text-blue-medium")
+
+# What a desktop Chrome sends; some servers answer bare clients differently
+BROWSER_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+class PageFetcher:
+    """Fetch a page over HTTP first, with the browser pool as the fallback.
+
+    After ``max_misses`` HTTP misses in a row (the site is likely serving a
+    bot check) the HTTP attempt is skipped for the next ``pause_pages``
+    pages, then tried again, so a blocked fast path does not add a wasted
+    request to every page.
+    """
+
+    def __init__(self, pool, transport=None, http=True, max_misses=5, pause_pages=50, metrics=None):
+        self.pool = pool
+        self.transport = transport
+        self.http = http and transport is not None
+        self.max_misses = max_misses
+        self.pause_pages = pause_pages
+        self.metrics = metrics or Metrics()
+        self._misses = 0
+        self._paused = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, url, markers=PROFILE_MARKERS):
+        return self.fetch_if_modified(url, markers)[0]
+
+    def fetch_if_modified(self, url, markers=PROFILE_MARKERS, etag=None, last_modified=None):
+        """``fetch``, sending the ``ETag``/``Last-Modified`` of a copy fetched before.
+
+        Returns ``(html, validators)``. ``html`` is None when the server
+        answers 304 Not Modified; ``validators`` holds the response's
+        ``ETag`` and ``Last-Modified`` headers (none after a browser load).
+        """
+        if self._use_http():
+            headers = dict(BROWSER_HEADERS)
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+            response = self._fetch_http(url, markers, headers)
+            if response is not None:
+                validators = {name: response.headers[name] for name in ("ETag", "Last-Modified")
+                              if response.headers.get(name)}
+                return (None if response.status_code == 304 else response.text), validators
+        with self.metrics.stage("fetch.browser"):
+            with self.pool.session() as session:
+                html = session.get_page_source(url)
+        self.metrics.count("fetch.browser.ok" if all(marker in html for marker in markers) else "fetch.browser.miss")
+        return html, {}
+
+    def _use_http(self):
+        if not self.http:
+            return False
+        with self._lock:
+            if self._paused:
+                self._paused -= 1
+                self.metrics.count("fetch.http.paused")
+                return False
+            return True
+
+    def _fetch_http(self, url, markers, headers):
+        """The response if it is usable (a complete page or a 304), else None."""
+        try:
+            with self.metrics.stage("fetch.http"):
+                response = self.transport.get(url, headers=headers, stage=None, retries=0)
+                html = response.text
+        except Exception as e:
+            self.metrics.count("fetch.http.error", error=type(e).__name__)
+            self._missed()
+            return None
+        not_modified = response.status_code == 304
+        if not_modified or (response.status_code == 200 and all(marker in html for marker in markers)):
+            with self._lock:
+                self._misses = 0
+            self.metrics.count("fetch.http.not_modified" if not_modified else "fetch.http.ok")
+            return response
+        self.metrics.count("fetch.http.miss", status=response.status_code)
+        self._missed()
+        return None
+
+    def _missed(self):
+        with self._lock:
+            self._misses += 1
+            if self._misses >= self.max_misses:
+                self._misses = 0
+                self._paused = self.pause_pages
+
+    def summary(self):
+        counters = self.metrics.snapshot()["counters"]
+        http_ok = counters.get("fetch.http.ok", 0) + counters.get("fetch.http.not_modified", 0)
+        browser = counters.get("fetch.browser.ok", 0) + counters.get("fetch.browser.miss", 0)
+        total = http_ok + browser
+        if not total:
+            return "No BBB pages fetched"
+        return f"BBB pages: {http_ok}/{total} over plain HTTP, {browser} in the browser"
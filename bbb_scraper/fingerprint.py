@@ -0,0 +1,230 @@
+"""Change detection for refresh runs: only re-scrape BBB profiles that changed.
+
+``FingerprintStore`` keeps, per search and profile URL, a hash of the
+fields extracted from the profile, the ``ETag``/``Last-Modified`` headers
+it was served with, and the rows it produced. A refresh run sends those
+headers back (a ``304 Not Modified`` skips the download), compares the
+hash of the freshly parsed profile, and reuses the stored rows for
+unchanged profiles instead of running the owner and people lookups again.
+At the end it reports which businesses are new, changed or removed since
+the previous run of the same search.
+"""
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .fetch import PROFILE_MARKERS
+from .metrics import Metrics
+from .records import PersonRecord
+
+DEFAULT_FINGERPRINT_PATH = os.path.join(os.path.expanduser("~"), ".bbb_scraper", "fingerprints.sqlite3")
+
+
+def profile_hash(profile):
+    """sha256 of the fields a run reads from a ``BusinessProfile``."""
+    from .llm import trim_profile_text
+
+    sections = {
+        "name": profile.name,
+        "address": profile.address,
+        "start_date": profile.start_date,
+        "owners": profile.owners,
+        # Only the sections the LLM fallback is shown, not ads or reviews
+        "text": trim_profile_text(profile.page_text) if profile.page_text else None,
+    }
+    return hashlib.sha256(json.dumps(sections, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def search_key(search_keywords, state):
+    return f"{' '.join(search_keywords.lower().split())}|{' '.join(state.lower().split())}"
+
+
+@dataclass
+class Fingerprint:
+    hash: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    business_name: Optional[str] = None
+    rows: List[PersonRecord] = field(default_factory=list)
+
+
+@dataclass
+class RefreshDiff:
+    """Businesses (profile URL, name) that appeared, changed or disappeared since the previous run."""
+    new: list = field(default_factory=list)
+    changed: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    unchanged: int = 0
+
+    def summary(self):
+        return (f"Refresh: {len(self.new)} new, {len(self.changed)} changed, {len(self.removed)} removed, "
+                f"{self.unchanged} unchanged businesses")
+
+    def write_csv(self, path):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Change", "Business Name", "URL"])
+            for change, entries in (("new", self.new), ("changed", self.changed), ("removed", self.removed)):
+                for url, name in entries:
+                    writer.writerow([change, name or "", url])
+
+
+class FingerprintStore:
+    """SQLite table of profile fingerprints and the rows each profile produced, per search."""
+
+    def __init__(self, path=DEFAULT_FINGERPRINT_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS runs (search TEXT, run INTEGER, started_at REAL, "
+                         "finished INTEGER, PRIMARY KEY (search, run))")
+        self._db.execute("CREATE TABLE IF NOT EXISTS profiles (search TEXT, url TEXT, hash TEXT, etag TEXT, "
+                         "last_modified TEXT, business_name TEXT, rows TEXT, seen_run INTEGER, "
+                         "changed_run INTEGER, first_run INTEGER, PRIMARY KEY (search, url))")
+        self._db.commit()
+        self._lock = threading.Lock()
+
+    def start_run(self, search, resume=False):
+        """Run number for ``search``; a resumed run keeps the number of the run it continues."""
+        with self._lock:
+            last = self._db.execute("SELECT run, finished FROM runs WHERE search = ? ORDER BY run DESC LIMIT 1",
+                                    (search,)).fetchone()
+            if resume and last is not None and not last[1]:
+                return last[0]
+            run = last[0] + 1 if last is not None else 1
+            self._db.execute("INSERT INTO runs VALUES (?, ?, ?, 0)", (search, run, time.time()))
+            self._db.commit()
+            return run
+
+    def get(self, search, url):
+        with self._lock:
+            row = self._db.execute("SELECT hash, etag, last_modified, business_name, rows FROM profiles "
+                                   "WHERE search = ? AND url = ?", (search, url)).fetchone()
+        if row is None:
+            return None
+        rows = [PersonRecord.from_dict(data) for data in json.loads(row[4] or "[]")]
+        return Fingerprint(row[0], row[1], row[2], row[3], rows)
+
+    def mark_seen(self, search, url, run):
+        with self._lock:
+            self._db.execute("UPDATE profiles SET seen_run = ? WHERE search = ? AND url = ?", (run, search, url))
+            self._db.commit()
+
+    def set_validators(self, search, url, etag, last_modified):
+        with self._lock:
+            self._db.execute("UPDATE profiles SET etag = ?, last_modified = ? WHERE search = ? AND url = ?",
+                             (etag, last_modified, search, url))
+            self._db.commit()
+
+    def put(self, search, url, run, fingerprint):
+        """Store a new or changed profile's fingerprint and rows as seen and changed in ``run``."""
+        rows = json.dumps([record.as_dict() for record in fingerprint.rows])
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO profiles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (search, url) DO UPDATE SET "
+                "hash = excluded.hash, etag = excluded.etag, last_modified = excluded.last_modified, "
+                "business_name = excluded.business_name, rows = excluded.rows, seen_run = excluded.seen_run, "
+                "changed_run = excluded.changed_run",
+                (search, url, fingerprint.hash, fingerprint.etag, fingerprint.last_modified,
+                 fingerprint.business_name, rows, run, run, run))
+            self._db.commit()
+
+    def finish_run(self, search, run, complete=True):
+        """The diff between ``run`` and the run before it; ``removed`` is only filled for a ``complete`` search."""
+        with self._lock:
+            previous = self._db.execute("SELECT MAX(run) FROM runs WHERE search = ? AND run < ?",
+                                        (search, run)).fetchone()[0]
+            rows = self._db.execute("SELECT url, business_name, seen_run, changed_run, first_run FROM profiles "
+                                    "WHERE search = ?", (search,)).fetchall()
+            self._db.execute("UPDATE runs SET finished = 1 WHERE search = ? AND run = ?", (search, run))
+            self._db.commit()
+        diff = RefreshDiff()
+        for url, name, seen_run, changed_run, first_run in rows:
+            if seen_run == run:
+                if changed_run != run:
+                    diff.unchanged += 1
+                elif first_run == run:
+                    diff.new.append((url, name))
+                else:
+                    diff.changed.append((url, name))
+            elif complete and previous is not None and seen_run == previous:
+                diff.removed.append((url, name))
+        return diff
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ProfileRefresh:
+    """One refresh run of a search, plugged into ``Pipeline`` as its ``refresh`` hook.
+
+    ``fetch(url)`` loads a profile with a conditional request (None for a
+    304), ``reuse(url, profile)`` returns the stored rows of an unchanged
+    profile, ``record(url, profile, rows)`` stores a new or changed one and
+    ``finish()`` returns the ``RefreshDiff``.
+    """
+
+    def __init__(self, store, search, run, fetcher, page_cache=None, metrics=None):
+        self.store = store
+        self.search = search
+        self.run = run
+        self.fetcher = fetcher
+        self.page_cache = page_cache
+        self.metrics = metrics or Metrics()
+        self._validators = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, url):
+        stored = self.store.get(self.search, url)
+        # Seen as soon as the search lists it, even if loading it fails
+        self.store.mark_seen(self.search, url, self.run)
+        if stored is None:
+            html, validators = self.fetcher.fetch_if_modified(url, PROFILE_MARKERS)
+        else:
+            html, validators = self.fetcher.fetch_if_modified(url, PROFILE_MARKERS, stored.etag,
+                                                              stored.last_modified)
+        with self._lock:
+            self._validators[url] = validators
+        if html is not None and self.page_cache is not None and PROFILE_MARKERS[0] in html:
+            self.page_cache.put(url, html, "bbb_profile")
+        return html
+
+    def reuse(self, url, profile):
+        stored = self.store.get(self.search, url)
+        if stored is None:
+            return None
+        if profile is not None and profile_hash(profile) != stored.hash:
+            self.metrics.count("refresh.changed")
+            return None
+        self.metrics.count("refresh.unchanged")
+        with self._lock:
+            validators = self._validators.pop(url, {})
+        if validators:
+            # Same content under new headers; send those next time
+            self.store.set_validators(self.search, url, validators.get("ETag"), validators.get("Last-Modified"))
+        return stored.rows
+
+    def record(self, url, profile, rows):
+        with self._lock:
+            validators = self._validators.pop(url, {})
+        self.store.put(self.search, url, self.run, Fingerprint(
+            profile_hash(profile), validators.get("ETag"), validators.get("Last-Modified"), profile.name, rows))
+
+    def finish(self, complete=True):
+        return self.store.finish_run(self.search, self.run, complete)
@@ -0,0 +1,360 @@
+"""Queue of keyword/location jobs run concurrently on one shared browser pool.
+
+    scheduler = JobScheduler("token", Settings(), max_jobs=2, browsers=4)
+    job = scheduler.submit("plumber", "Las Vegas")
+    job.pause(); job.resume(); job.cancel()
+    scheduler.wait()
+    scheduler.shutdown()
+
+Jobs run in worker threads, ``max_jobs`` at a time, and take browsers from
+a single ``BrowserPool`` of ``browsers`` sessions, so adding jobs never
+starts more Chrome instances than that. They also share one HTTP
+transport, LLM extractor and search-page rate limiter, so the per-host
+limits (``bbb_scraper.transport.HOST_LIMITS``), ``llm_concurrency`` and
+``search_pages_per_second`` hold for all jobs together. Each job has its
+own ``Scraper`` (with its own metrics), output file and journal. A
+cancelled job keeps its journal and can be resumed later.
+"""
+import itertools
+import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+from .metrics import Metrics
+from .settings import Settings
+
+QUEUED = "queued"
+RUNNING = "running"
+PAUSED = "paused"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+
+def _ignore(*args):
+    pass
+
+
+def _slug(text):
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-") or "job"
+
+
+def default_output_path(keywords, location, output_dir=".", extension=".csv"):
+    """``("Plumber", "Las Vegas")`` -> ``./plumber_las-vegas.csv``."""
+    return os.path.join(output_dir, f"{_slug(keywords)}_{_slug(location)}{extension}")
+
+
+class JobCancelled(Exception):
+    """Raised inside a job's run once it has been cancelled."""
+
+
+class OutputInUse(ValueError):
+    """Raised by ``JobScheduler.submit`` when a queued or running job already writes that output file."""
+
+
+def _same_file_key(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+class ScrapeJob:
+    """One search in the queue, with its live progress and pause/cancel controls."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, keywords, location, output_path=None, resume=False, refresh=False):
+        self.id = next(self._ids)
+        self.keywords = keywords
+        self.location = location
+        self.output_path = output_path or default_output_path(keywords, location)
+        # Continue from the output's run journal instead of starting over
+        self.from_journal = resume
+        # Re-scrape only the profiles that changed since the last run of this search
+        self.refresh = refresh
+        self.state = QUEUED
+        self.status = ""
+        self.error = None
+        self.discovered = 0
+        self.processed = 0
+        self.saved = 0
+        self.scraper = None
+        self.started_at = None
+        self.finished_at = None
+        self._processed_before = None
+        self._paused_for = 0.0
+        self._paused_at = None
+        self._running = threading.Event()
+        self._running.set()
+        self._cancelled = threading.Event()
+
+    def __repr__(self):
+        return f"ScrapeJob({self.id}, {self.keywords!r}, {self.location!r}, {self.state})"
+
+    @property
+    def name(self):
+        return f"{self.keywords} / {self.location}"
+
+    @property
+    def metrics(self):
+        return self.scraper.metrics if self.scraper is not None else Metrics()
+
+    @property
+    def finished(self):
+        return self.state in FINISHED_STATES
+
+    def pause(self):
+        """Stop starting new businesses; the ones in flight finish."""
+        if not self.finished and self._running.is_set():
+            self._running.clear()
+            self._paused_at = time.monotonic()
+            if self.state == RUNNING:
+                self.state = PAUSED
+
+    def resume(self):
+        if not self._running.is_set():
+            # A pause that ended before the job started is not run time to subtract
+            if self.started_at is not None:
+                self._paused_for += time.monotonic() - self._paused_at
+            self._paused_at = None
+            self._running.set()
+            if self.state == PAUSED:
+                self.state = RUNNING
+
+    def cancel(self):
+        self._cancelled.set()
+        if self.state == QUEUED:
+            self.state = CANCELLED
+        # A paused job has to wake up to notice
+        self._running.set()
+
+    @property
+    def paused(self):
+        return not self._running.is_set() and not self.finished
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    async def checkpoint(self):
+        """Awaited by the pipeline before each page and business."""
+        import asyncio
+
+        while not self._running.is_set():
+            await asyncio.sleep(0.2)
+        if self._cancelled.is_set():
+            raise JobCancelled(f"Job {self.name} was cancelled")
+
+    def report_progress(self, processed, discovered):
+        if self._processed_before is None:
+            # Businesses finished by an earlier run of a resumed job
+            self._processed_before = processed
+        self.processed = processed
+        self.discovered = discovered
+
+    @property
+    def progress(self):
+        """Share of the businesses found so far that are done (the total grows while pages are searched)."""
+        if self.state == DONE:
+            return 1.0
+        return self.processed / self.discovered if self.discovered else 0.0
+
+    def active_time(self):
+        """Seconds spent running, not counting pauses."""
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at or time.monotonic()
+        paused = self._paused_for + (time.monotonic() - self._paused_at if self._paused_at is not None else 0.0)
+        return max(0.0, end - self.started_at - paused)
+
+    def seconds_per_business(self):
+        """Measured seconds per finished business page in this run (None before the first one)."""
+        done = self.processed - (self._processed_before or 0)
+        return self.active_time() / done if done > 0 else None
+
+    def eta(self):
+        """Seconds left for the businesses found so far, or None if unknown."""
+        if self.finished:
+            return 0.0
+        per_business = self.seconds_per_business()
+        if per_business is None:
+            return None
+        return per_business * max(0, self.discovered - self.processed)
+
+
+class JobScheduler:
+    """Run submitted ``ScrapeJob`` objects, ``max_jobs`` at a time, on one pool of ``browsers`` sessions.
+
+    ``on_status(job, message)`` and ``on_row(job, record)`` are called from
+    the job threads. ``page_cache`` and ``seen_index`` are shared by every
+    job; both are safe to use from several threads. ``fingerprints`` (a
+    ``FingerprintStore``) is used by the jobs submitted with ``refresh``.
+    With ``trace``, each job writes its stage timings to
+    ``<output>.trace.jsonl``.
+    """
+
+    def __init__(self, scrapedo_key, settings=None, max_jobs=2, browsers=None, page_cache=None,
+                 seen_index=None, fingerprints=None, on_status=_ignore, on_row=_ignore, trace=False):
+        self.scrapedo_key = scrapedo_key
+        self.settings = settings or Settings()
+        self.max_jobs = max_jobs
+        self.browsers = browsers or self.settings.browser_pool_size
+        self.page_cache = page_cache
+        self.seen_index = seen_index
+        self.fingerprints = fingerprints
+        self.on_status = on_status
+        self.on_row = on_row
+        self.trace = trace
+        self.metrics = Metrics()
+        self.jobs = []
+        self._queue = queue.Queue()
+        self._threads = []
+        self._pool = None
+        self._executor = None
+        self._transport = None
+        self._llm = None
+        self._search_limiter = None
+        self._lock = threading.Lock()
+
+    def submit(self, keywords, location, output_path=None, resume=False, refresh=False):
+        """Queue a search; it starts as soon as a job slot is free.
+
+        Raises ``OutputInUse`` while an unfinished job owns the same output file.
+        """
+        if refresh and self.fingerprints is None:
+            raise ValueError("Refresh jobs need a scheduler with a fingerprint store")
+        job = ScrapeJob(keywords, location, output_path, resume, refresh)
+        key = _same_file_key(job.output_path)
+        with self._lock:
+            # Two jobs on one output would both truncate and append to the
+            # same file and journal
+            for other in self.jobs:
+                if not other.finished and _same_file_key(other.output_path) == key:
+                    raise OutputInUse(f"{other.name} is still writing {other.output_path}")
+            self.jobs.append(job)
+            self._start()
+        self._queue.put(job)
+        return job
+
+    def _start(self):
+        if self._threads:
+            return
+        from .browser import BrowserPool
+        from .engine import Scraper
+        from .llm import OwnerExtractor
+        from .ratelimit import RateLimiter
+        from .transport import Transport
+
+        settings = self.settings
+        self._pool = BrowserPool(size=self.browsers, max_pages=settings.pages_per_browser,
+                                 headless=settings.headless, metrics=self.metrics)
+        # Shared like the browsers: one set of rate limits for every job
+        self._transport = Transport(timeout=settings.http_timeout, retries=settings.http_retries,
+                                    pool_size=self.max_jobs * max(settings.http_concurrency, settings.llm_concurrency),
+                                    metrics=self.metrics)
+        self._llm = OwnerExtractor(Scraper.llm_chat_url, concurrency=settings.llm_concurrency,
+                                   batch_size=settings.llm_batch_size, transport=self._transport, metrics=self.metrics)
+        self._search_limiter = RateLimiter(settings.search_pages_per_second, burst=self.browsers)
+        # One thread per browser, shared by every job, like a single run's executor
+        self._executor = ThreadPoolExecutor(max_workers=self.browsers, thread_name_prefix="browser")
+        for i in range(self.max_jobs):
+            thread = threading.Thread(target=self._work, name=f"job-{i + 1}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._run(job)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, job):
+        # The engine (asyncio, the pipeline) loads with the first job, not with the GUI
+        from .engine import Scraper
+
+        if job.cancelled:
+            job.state = CANCELLED
+            return
+        settings = self.settings
+        if self.trace:
+            # Jobs run side by side; each gets its own trace file
+            settings = replace(settings, trace_path=job.output_path + ".trace.jsonl")
+        job.scraper = Scraper(self.scrapedo_key, settings, page_cache=self.page_cache, seen_index=self.seen_index,
+                              fingerprints=self.fingerprints if job.refresh else None, transport=self._transport,
+                              llm=self._llm, search_limiter=self._search_limiter)
+        job.started_at = time.monotonic()
+        if job._paused_at is not None:
+            # Paused while still queued: the pause starts counting now
+            job._paused_at = job.started_at
+            job.state = PAUSED
+        else:
+            job.state = RUNNING
+
+        def on_status(message):
+            job.status = message
+            self.on_status(job, message)
+
+        def on_row(record):
+            job.saved += 1
+            self.on_row(job, record)
+
+        try:
+            result = job.scraper.run(job.keywords, job.location, job.output_path, job.from_journal,
+                                     on_status=on_status, on_row=on_row,
+                                     on_progress=job.report_progress, pool=self._pool,
+                                     browser_executor=self._executor, checkpoint=job.checkpoint)
+        except JobCancelled:
+            job.state = CANCELLED
+            on_status("Cancelled; resume it to pick up where it stopped")
+        except Exception as e:
+            job.error = e
+            job.state = FAILED
+            on_status(f"Error: {e}")
+        else:
+            job.discovered = result.discovered
+            job.saved = result.saved
+            job.state = DONE
+        finally:
+            job.finished_at = time.monotonic()
+
+    @property
+    def active(self):
+        return [job for job in self.jobs if not job.finished]
+
+    def wait(self):
+        """Block until every submitted job has finished."""
+        self._queue.join()
+
+    def shutdown(self, cancel=False):
+        """Stop the workers once the queue is empty (or right away, cancelling every job)."""
+        if cancel:
+            for job in self.jobs:
+                job.cancel()
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
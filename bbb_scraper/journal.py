@@ -0,0 +1,124 @@
+"""Append-only run journal used to resume interrupted runs.
+
+Every event (run started, business URL discovered, row emitted, business
+finished, ...) is written as one JSON line and flushed straight away, so
+after a crash the journal still says exactly which work was done.
+"""
+import json
+import os
+import threading
+import time
+
+
+def journal_path(output_path):
+    return output_path + ".journal"
+
+
+class RunJournal:
+    """Writes run events to ``path`` and replays them on resume."""
+
+    def __init__(self, path, params=None):
+        self.path = path
+        self.params = params or {}
+        self.discovered = []
+        self.done = set()
+        self.rows = 0
+        self.discovery_complete = False
+        self.finished = False
+        self.resumed = False
+        self._known = set()
+        self._lock = threading.Lock()
+        self._file = None
+
+    @classmethod
+    def start(cls, path, params):
+        """Begin a fresh journal, replacing any previous one."""
+        journal = cls(path, params)
+        journal._file = open(path, 'w', encoding='utf-8')
+        journal._write("start", params=params)
+        return journal
+
+    @classmethod
+    def load(cls, path):
+        """Replay an existing journal without opening it for writing."""
+        journal = cls(path)
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave the last line half-written
+                    continue
+                journal._apply(entry)
+        return journal
+
+    @classmethod
+    def resume(cls, path):
+        """Replay the journal at ``path`` and keep appending to it."""
+        journal = cls.load(path)
+        journal.resumed = True
+        journal._file = open(path, 'a', encoding='utf-8')
+        journal._write("resume")
+        return journal
+
+    @staticmethod
+    def exists(path):
+        return os.path.exists(path) and os.path.getsize(path) > 0
+
+    def _apply(self, entry):
+        event = entry.get("event")
+        if event == "start":
+            self.params = entry.get("params", {})
+        elif event == "discovered" and entry["url"] not in self._known:
+            self._known.add(entry["url"])
+            self.discovered.append(entry["url"])
+        elif event == "done":
+            self.done.add(entry["url"])
+        elif event == "row":
+            self.rows += 1
+        elif event == "discovery_complete":
+            self.discovery_complete = True
+        elif event == "finished":
+            self.finished = True
+
+    def _write(self, event, **fields):
+        entry = dict(fields, event=event, time=time.time())
+        with self._lock:
+            self._apply(entry)
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+
+    @property
+    def pending(self):
+        """Discovered business URLs that have not been finished yet, in discovery order."""
+        return [url for url in self.discovered if url not in self.done]
+
+    def is_known(self, url):
+        return url in self._known
+
+    def record_discovered(self, url):
+        self._write("discovered", url=url)
+
+    def record_row(self):
+        # Only counted: the row itself is in the output file
+        self._write("row")
+
+    def record_done(self, url):
+        self._write("done", url=url)
+
+    def record_discovery_complete(self):
+        self._write("discovery_complete")
+
+    def record_finished(self):
+        self._write("finished")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
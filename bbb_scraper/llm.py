@@ -0,0 +1,291 @@
+"""Owner extraction with a local LLM, for profiles that list no owner.
+
+The model only needs the parts of a profile that can name an owner, so the
+page text is trimmed to those first (``trim_profile_text``). Answers are
+memoized in memory by a hash of the trimmed text, for as long as the
+extractor lives: a business seen again by the same scraper, or by another
+job sharing the extractor, skips the model. A new process starts with an
+empty memo.
+"""
+import asyncio
+import copy
+import hashlib
+import json
+import re
+import threading
+import weakref
+from collections import OrderedDict
+
+from .metrics import Metrics
+from .transport import Transport
+
+# Section headings on BBB profiles whose next few lines can name an owner
+SECTION_RE = re.compile(r"^(business details|about this business|about|additional contact information|"
+                        r"contact information|principal contacts|customer contacts|management)\b", re.IGNORECASE)
+PERSON_RE = re.compile(r"\b(owner|president|ceo|founder|founded|principal|manager|proprietor)\b", re.IGNORECASE)
+SECTION_LINES = 8
+
+EMPTY = {"owner0": "", "title": ""}
+
+PROMPT = """
+Extract the business owner's name and title from the following text.
+Remove any honorifics (Mr, Ms, Mrs, Dr, etc.).
+Respond ONLY in this strict JSON format:
+{{
+  "owner": "string",
+  "title": "string"
+}}
+
+Profile:
+{profile}
+"""
+
+BATCH_PROMPT = """
+For each numbered profile below, extract the business owner's name and title.
+Remove any honorifics (Mr, Ms, Mrs, Dr, etc.).
+Respond ONLY with a JSON array holding one object per profile, in order:
+[
+  {{"profile": 1, "owner": "string", "title": "string"}}
+]
+
+{profiles}
+"""
+
+
+def trim_profile_text(text, max_chars=3000):
+    """Keep the lines of a profile's text that can name its owner, at most ``max_chars``.
+
+    That is the few lines after each contact/about/details heading, and any
+    line mentioning an owner-like role. Text without either is cut to its
+    first ``max_chars`` characters.
+    """
+    lines = text.splitlines()
+    keep = set()
+    for i, line in enumerate(lines):
+        if SECTION_RE.match(line):
+            keep.update(range(i, min(i + SECTION_LINES + 1, len(lines))))
+        elif PERSON_RE.search(line):
+            keep.add(i)
+    if not keep:
+        return text[:max_chars]
+    trimmed = "\n".join(lines[i] for i in sorted(keep))
+    return trimmed[:max_chars]
+
+
+def text_key(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def parse_owner(content):
+    """Pull ``{"owner": ..., "title": ...}`` out of a model reply; None if there is none."""
+    match = re.search(r"\{\s*\"owner\".*\}", content, re.DOTALL)
+    if not match:
+        return None
+    try:
+        result = json.loads(match.group(0))
+    except json.JSONDecodeError:
+        return None
+    # Enforce strict format (in case model omits a field)
+    return {"owner0": result.get("owner", ""), "title": result.get("title", "")}
+
+
+def parse_owners(content, count):
+    """Answers to a batched prompt, one per profile; None where one is missing."""
+    results = [None] * count
+    match = re.search(r"\[.*\]", content, re.DOTALL)
+    if not match:
+        return results
+    try:
+        items = json.loads(match.group(0))
+    except json.JSONDecodeError:
+        return results
+    if not isinstance(items, list):
+        return results
+    for position, item in enumerate(items):
+        if not isinstance(item, dict):
+            continue
+        index = item.get("profile", position + 1)
+        if isinstance(index, int) and 1 <= index <= count:
+            results[index - 1] = {"owner0": item.get("owner", ""), "title": item.get("title", "")}
+    return results
+
+
+class _LoopState:
+    """Per event loop: the concurrency limit and the batch being collected."""
+
+    def __init__(self, loop, concurrency):
+        self.loop = loop
+        self.limit = asyncio.Semaphore(concurrency)
+        self.pending = []
+        self.inflight = {}
+        self.timer = None
+        # The loop only keeps weak references to tasks
+        self.tasks = set()
+
+
+class OwnerExtractor:
+    """Ask an Ollama-style ``/api/chat`` endpoint who owns a business.
+
+    ``extract`` blocks; ``extract_async`` runs at most ``concurrency``
+    requests at once and, with ``batch_size`` > 1, collects profiles for up
+    to ``batch_wait`` seconds and asks about several in one prompt; it
+    returns None when the model could not be asked or its answer not read. Both
+    share the memo and go through ``transport`` (kept-alive connections,
+    retries; see ``bbb_scraper.transport.Transport``). One extractor may be
+    used from several threads and event loops at once (``with_metrics``
+    gives each user its own stats); ``concurrency`` then caps the requests
+    of all of them together.
+    """
+
+    def __init__(self, url, model="mistral", concurrency=2, batch_size=1, batch_wait=0.05,
+                 timeout=120, memo_size=4096, metrics=None, transport=None):
+        self.url = url
+        self.model = model
+        self.concurrency = concurrency
+        self.batch_size = max(1, batch_size)
+        self.batch_wait = batch_wait
+        self.timeout = timeout
+        self.memo_size = memo_size
+        self.metrics = metrics or Metrics()
+        self._memo = OrderedDict()
+        self._lock = threading.Lock()
+        self._owns_transport = transport is None
+        self.transport = transport or Transport(limits={}, pool_size=concurrency, metrics=self.metrics)
+        # Requests in flight across every thread and event loop
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._states = weakref.WeakKeyDictionary()
+
+    def with_metrics(self, metrics):
+        """This extractor (memo, concurrency limit, transport) counting into ``metrics``."""
+        view = copy.copy(self)
+        view.metrics = metrics
+        view.transport = self.transport.with_metrics(metrics)
+        view._owns_transport = False
+        return view
+
+    def extract(self, page_text):
+        text = trim_profile_text(page_text)
+        key = text_key(text)
+        cached = self._recall(key)
+        if cached is not None:
+            return cached
+        result = self._ask([text])[0]
+        if result is None:
+            return dict(EMPTY)
+        self._remember(key, result)
+        return dict(result)
+
+    async def extract_async(self, page_text):
+        text = trim_profile_text(page_text)
+        key = text_key(text)
+        cached = self._recall(key)
+        if cached is not None:
+            return cached
+        state = self._loop_state()
+        future = state.inflight.get(key)
+        if future is None:
+            # The same text asked twice at once waits for the first answer
+            future = state.inflight[key] = state.loop.create_future()
+            state.pending.append((text, key, future))
+            if len(state.pending) >= self.batch_size:
+                self._flush(state)
+            elif state.timer is None:
+                state.timer = state.loop.call_later(self.batch_wait, self._flush, state)
+        result = await asyncio.shield(future)
+        return dict(result) if result is not None else None
+
+    def close(self):
+        if self._owns_transport:
+            self.transport.close()
+
+    def _recall(self, key):
+        with self._lock:
+            result = self._memo.get(key)
+            if result is None:
+                return None
+            self._memo.move_to_end(key)
+        self.metrics.count("llm.memo_hit")
+        return dict(result)
+
+    def _remember(self, key, result):
+        with self._lock:
+            self._memo[key] = result
+            self._memo.move_to_end(key)
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+    def _loop_state(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._states.get(loop)
+            if state is None:
+                state = self._states[loop] = _LoopState(loop, self.concurrency)
+        return state
+
+    def _flush(self, state):
+        if state.timer is not None:
+            state.timer.cancel()
+            state.timer = None
+        while state.pending:
+            batch, state.pending = state.pending[:self.batch_size], state.pending[self.batch_size:]
+            task = state.loop.create_task(self._send(state, batch))
+            state.tasks.add(task)
+            task.add_done_callback(state.tasks.discard)
+
+    async def _send(self, state, batch):
+        try:
+            async with state.limit:
+                results = await asyncio.to_thread(self._ask, [text for text, _, _ in batch])
+        except Exception as e:
+            self.metrics.count("llm.failed", error=type(e).__name__)
+            results = [None] * len(batch)
+        for (text, key, future), result in zip(batch, results):
+            state.inflight.pop(key, None)
+            if result is not None:
+                self._remember(key, result)
+            if not future.done():
+                future.set_result(result)
+
+    def _ask(self, texts):
+        """Blocking: one prompt for one text, or a batched prompt for several."""
+        if len(texts) == 1:
+            content = self._chat(PROMPT.format(profile=texts[0]))
+            result = parse_owner(content) if content is not None else None
+            if content is not None and result is None:
+                self.metrics.count("llm.unparsed")
+            return [result]
+        profiles = "\n\n".join(f"Profile {i}:\n{text}" for i, text in enumerate(texts, 1))
+        content = self._chat(BATCH_PROMPT.format(profiles=profiles))
+        if content is None:
+            return [None] * len(texts)
+        results = parse_owners(content, len(texts))
+        # Whatever the batch answer left out is asked about on its own
+        for i, result in enumerate(results):
+            if result is None:
+                self.metrics.count("llm.batch_miss")
+                results[i] = self._ask([texts[i]])[0]
+        return results
+
+    def _chat(self, prompt):
+        """Send one chat request and return the streamed reply text, or None on an HTTP error."""
+        payload = {"model": self.model, "messages": [{"role": "user", "content": prompt}]}
+        with self._slots, self.metrics.stage("llm", prompt_chars=len(prompt)):
+            # Timed here as "llm", including the streamed reply, not as "http"
+            with self.transport.post(self.url, json=payload, stream=True, timeout=self.timeout,
+                                     stage=None) as response:
+                if response.status_code != 200:
+                    self.metrics.count("llm.failed", status=response.status_code)
+                    return None
+                collected_content = ""
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line:
+                        continue
+                    try:
+                        json_data = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if "message" in json_data and "content" in json_data["message"]:
+                        collected_content += json_data["message"]["content"]
+                    if json_data.get("done", False):
+                        break
+                return collected_content
@@ -0,0 +1,142 @@
+"""Per-stage timings and counters for a run.
+
+    with metrics.stage("page_load"):
+        ...
+    metrics.count("person_details.error")
+
+Every timed stage and counter update can also be appended to a JSON-lines
+trace file, one object per event, for offline analysis. ``snapshot()`` is
+safe to call from another thread while a run is going (the GUI polls it).
+"""
+import json
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+PROFILERS = {"cprofile": ".prof", "pyinstrument": ".html"}
+
+
+class StageStats:
+    __slots__ = ("count", "total", "max", "errors")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.errors = 0
+
+
+class Metrics:
+    """Thread-safe timers and counters, optionally traced to ``trace_path``."""
+
+    def __init__(self, trace_path=None):
+        self.started = time.perf_counter()
+        self.counters = Counter()
+        self._stages = {}
+        self._lock = threading.Lock()
+        # Line buffered so the trace is readable while the run is going
+        self._trace = open(trace_path, "a", buffering=1, encoding="utf-8") if trace_path else None
+
+    @contextmanager
+    def stage(self, name, **fields):
+        """Time the ``with`` block as one call of ``name``; exceptions count as errors."""
+        start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self.record(name, time.perf_counter() - start, error, **fields)
+
+    def record(self, name, seconds, error=None, **fields):
+        with self._lock:
+            stats = self._stages.get(name)
+            if stats is None:
+                stats = self._stages[name] = StageStats()
+            stats.count += 1
+            stats.total += seconds
+            stats.max = max(stats.max, seconds)
+            if error is not None:
+                stats.errors += 1
+            if self._trace is not None:
+                event = {"stage": name, "seconds": round(seconds, 6)}
+                if error is not None:
+                    event["error"] = error
+                event.update(fields)
+                self._write(event)
+
+    def count(self, name, n=1, **fields):
+        with self._lock:
+            self.counters[name] += n
+            if self._trace is not None:
+                self._write({"counter": name, "n": n, **fields})
+
+    def _write(self, event):
+        event["t"] = round(time.time(), 6)
+        event["thread"] = threading.current_thread().name
+        self._trace.write(json.dumps(event, default=str) + "\n")
+
+    def snapshot(self):
+        """Copy of the current numbers as plain dicts."""
+        with self._lock:
+            stages = {name: {"count": s.count, "total": s.total, "mean": s.total / s.count,
+                             "max": s.max, "errors": s.errors}
+                      for name, s in self._stages.items()}
+            counters = dict(self.counters)
+        return {"elapsed": time.perf_counter() - self.started, "stages": stages, "counters": counters}
+
+    def summary(self):
+        """Human readable table, slowest stage (by total time) first."""
+        snapshot = self.snapshot()
+        lines = [f"Elapsed {snapshot['elapsed']:.1f}s"]
+        for name, s in sorted(snapshot["stages"].items(), key=lambda item: -item[1]["total"]):
+            errors = f"  {s['errors']} errors" if s["errors"] else ""
+            lines.append(f"{name:<16} {s['count']:6d} x {s['mean']:7.3f}s  total {s['total']:8.1f}s"
+                         f"  max {s['max']:7.3f}s{errors}")
+        for name, n in sorted(snapshot["counters"].items()):
+            lines.append(f"{name:<16} {n:6d}")
+        return "\n".join(lines)
+
+    def close(self):
+        with self._lock:
+            if self._trace is not None:
+                self._trace.close()
+                self._trace = None
+
+
+@contextmanager
+def profiled(profiler, path):
+    """Profile the ``with`` block with ``"cprofile"`` or ``"pyinstrument"`` and save it to ``path``.
+
+    Both only sample the calling thread: the event loop and parsing are
+    covered, page loads on executor threads show up as time spent waiting.
+    """
+    if not profiler:
+        yield
+        return
+    if profiler == "cprofile":
+        import cProfile
+
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            profile.dump_stats(path)
+    elif profiler == "pyinstrument":
+        from pyinstrument import Profiler
+
+        profile = Profiler(async_mode="enabled")
+        profile.start()
+        try:
+            yield
+        finally:
+            profile.stop()
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(profile.output_html())
+    else:
+        raise ValueError(f"Unknown profiler {profiler!r}; use one of {', '.join(PROFILERS)}")
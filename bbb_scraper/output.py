@@ -0,0 +1,115 @@
+"""Incremental output for scraped people: a streamed CSV, or a SQLite/Parquet result store."""
+import csv
+import os
+
+from .records import PersonRecord
+
+BASE_COLUMNS = ['Name', 'Age', 'Position', 'Address', 'City', 'State', 'Business Name', 'Business Start Date']
+# Rows carry a variable number of ``Phone {i}`` / ``Email {i}`` keys. A
+# streamed CSV starts with room for this many of each and is rewritten
+# with a wider header when a row has more.
+MAX_PHONES = 5
+MAX_EMAILS = 5
+
+
+def csv_columns(phones=MAX_PHONES, emails=MAX_EMAILS):
+    return BASE_COLUMNS + [f'Phone {i}' for i in range(phones)] + [f'Email {i}' for i in range(emails)]
+
+
+COLUMNS = csv_columns()
+
+
+def _count(columns, prefix):
+    return sum(1 for column in columns if column.startswith(prefix + ' '))
+
+
+class CsvSink:
+    """Append rows to a CSV file as they arrive, skipping exact duplicates.
+
+    Only a hash per written row is kept in memory, so memory stays flat no
+    matter how long the run is. With ``append=True`` an existing file is
+    kept and its rows count as already written. No phone or email is
+    dropped: a row with more than the header has room for rewrites the file
+    once under a wider header (``widened`` counts how often).
+    """
+
+    def __init__(self, path, columns=COLUMNS, append=False):
+        self.path = path
+        self.columns = list(columns)
+        self.written = 0
+        self.widened = 0
+        self._seen = set()
+        resuming = append and os.path.exists(path) and os.path.getsize(path) > 0
+        if resuming:
+            with open(path, newline='', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                for row in reader:
+                    self._seen.add(self._key(PersonRecord.from_row(row)))
+                # An earlier run may have widened the header already
+                self.columns = list(reader.fieldnames or self.columns)
+        self._phones = _count(self.columns, 'Phone')
+        self._emails = _count(self.columns, 'Email')
+        self._open('a' if resuming else 'w')
+        if not resuming:
+            self._writer.writeheader()
+
+    def _open(self, mode):
+        self._file = open(self.path, mode, newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction='ignore')
+
+    def _key(self, record):
+        return hash(record.key())
+
+    def write(self, record):
+        """Write ``record`` (a ``PersonRecord``) unless an identical one was already written. Returns True if written."""
+        key = self._key(record)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        if len(record.phones) > self._phones or len(record.emails) > self._emails:
+            self._widen(max(self._phones, len(record.phones)), max(self._emails, len(record.emails)))
+        self._writer.writerow(record.to_row())
+        self.written += 1
+        return True
+
+    def _widen(self, phones, emails):
+        """Copy the rows written so far under a header with room for ``phones`` phones and ``emails`` emails."""
+        self._file.close()
+        self.columns = csv_columns(phones, emails)
+        self._phones, self._emails = phones, emails
+        temp_path = self.path + '.tmp'
+        with open(self.path, newline='', encoding='utf-8') as src, \
+                open(temp_path, 'w', newline='', encoding='utf-8') as dst:
+            writer = csv.DictWriter(dst, fieldnames=self.columns, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(csv.DictReader(src))
+        os.replace(temp_path, self.path)
+        self._open('a')
+        self.widened += 1
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+SINKS = {".csv": "csv", ".sqlite3": "sqlite", ".db": "sqlite", ".parquet": "parquet"}
+
+
+def open_sink(path, append=False):
+    """The sink for ``path``, chosen by its extension: CSV (default), SQLite or Parquet."""
+    kind = SINKS.get(os.path.splitext(path)[1].lower(), "csv")
+    if kind == "sqlite":
+        from .store import ResultStore
+        return ResultStore(path, append=append)
+    if kind == "parquet":
+        from .store import ParquetSink
+        return ParquetSink(path, append=append)
+    return CsvSink(path, append=append)
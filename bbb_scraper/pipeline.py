@@ -0,0 +1,295 @@
+"""Streaming scrape pipeline: discovery -> profile fetch -> extraction -> sink.
+
+Each stage runs as a set of asyncio tasks connected by bounded queues, so a
+slow stage pushes back on the ones before it instead of letting work pile up
+in memory, and the first rows reach the sink while pagination is still
+running.
+"""
+import asyncio
+import threading
+
+from .metrics import Metrics
+from .profile import extract_profile
+
+_DONE = object()
+
+
+class _BusinessDone:
+    def __init__(self, url):
+        self.url = url
+
+
+class IncompleteRows(list):
+    """Rows of a business some of whose lookups failed; written, but not stored by a refresh."""
+
+
+def _ignore(*args):
+    pass
+
+
+class Pipeline:
+    """Run one search through every stage.
+
+    ``discover`` returns an iterator of lists of business URLs (one list per
+    search results page). ``fetch_page(url)`` blocks and returns the page
+    HTML; it runs on ``fetch_executor`` with ``fetchers`` calls in flight.
+    ``enrich(profile)`` is a coroutine returning the rows (``PersonRecord``)
+    for one business. Rows go to ``sink.write(row)``, which returns False
+    for duplicates.
+
+    With a ``journal`` (see ``bbb_scraper.journal.RunJournal``) every
+    discovered URL, written row and finished business is recorded as it
+    happens, and businesses the journal already lists as done are skipped.
+
+    Stage timings and error counts go to ``metrics`` (``bbb_scraper.metrics.Metrics``).
+    ``on_failed(url)`` is called for every business that could not be processed.
+    With ``claim(url)``, a newly discovered URL is only queued if the call
+    returns True (see ``bbb_scraper.dedup.SeenIndex``); the rest count as
+    ``skipped``. ``on_done(url)`` is called once a business's rows are in
+    the sink; claimed businesses still unfinished when the run stops early
+    (cancelled, or failed) go to ``on_failed``. ``checkpoint()`` is a coroutine awaited before each search
+    results page and each business: it may wait (a paused job) or raise (a
+    cancelled one, see ``bbb_scraper.jobs``).
+
+    With ``refresh`` (see ``bbb_scraper.fingerprint.ProfileRefresh``),
+    ``fetch_page`` may return None for a page that has not changed, and
+    ``refresh.reuse(url, profile)`` can return the rows an unchanged
+    business produced before, skipping ``enrich``; rows of the businesses
+    that are enriched go to ``refresh.record(url, profile, rows)``. An
+    ``IncompleteRows`` result is written but not recorded, so the next
+    refresh looks the business up again.
+    """
+
+    def __init__(self, discover, fetch_page, enrich, sink, fetch_executor=None, fetchers=2, extractors=4,
+                 limit=None, queue_size=None, journal=None, on_status=_ignore, on_row=_ignore,
+                 on_progress=_ignore, metrics=None, on_failed=_ignore, claim=None, checkpoint=None,
+                 refresh=None, on_done=_ignore):
+        self.discover = discover
+        self.fetch_page = fetch_page
+        self.enrich = enrich
+        self.sink = sink
+        self.fetch_executor = fetch_executor
+        self.fetchers = fetchers
+        self.extractors = extractors
+        self.limit = limit
+        self.queue_size = queue_size or 2 * max(fetchers, extractors)
+        self.on_status = on_status
+        self.on_row = on_row
+        self.on_progress = on_progress
+        self.on_failed = on_failed
+        self.on_done = on_done
+        self.claim = claim
+        self.checkpoint = checkpoint
+        self.refresh = refresh
+        self.journal = journal
+        self.metrics = metrics or Metrics()
+        # Businesses finished in an earlier, interrupted run count as done
+        self.discovered = len(journal.done) if journal is not None else 0
+        self.processed = self.discovered
+        self.rows = 0
+        self.skipped = 0
+        self._seen = set()
+        # Claimed by this run and not finished or failed yet; claims are
+        # made on worker threads, so guarded by a lock
+        self._claimed = set()
+        self._claims_lock = threading.Lock()
+        self._stopped = False
+
+    async def run(self):
+        urls = asyncio.Queue(self.queue_size)
+        pages = asyncio.Queue(self.queue_size)
+        rows = asyncio.Queue(self.queue_size)
+
+        fetchers = [asyncio.create_task(self._fetch(urls, pages)) for _ in range(self.fetchers)]
+        extractors = [asyncio.create_task(self._extract(pages, rows)) for _ in range(self.extractors)]
+        sink = asyncio.create_task(self._sink(rows))
+        stages = fetchers + extractors + [sink]
+
+        async def drive():
+            await self._discover(urls)
+            await self._finish(urls, fetchers)
+            await self._finish(pages, extractors)
+            await self._finish(rows, [sink])
+
+        driver = asyncio.create_task(drive())
+        try:
+            # If a stage dies, its queue stops draining and the stages feeding
+            # it would block forever; stop at the first failure instead
+            await asyncio.wait(stages + [driver], return_when=asyncio.FIRST_EXCEPTION)
+            for task in stages:
+                if task.done() and not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+            await driver
+        finally:
+            for task in stages + [driver]:
+                task.cancel()
+            # Stopped early: let other runs take what this one will not finish
+            with self._claims_lock:
+                self._stopped = True
+                unfinished, self._claimed = self._claimed, set()
+            for url in unfinished:
+                self.on_failed(url)
+        return self.rows
+
+    def _claim(self, url):
+        """Blocking: True if this run now owns ``url``."""
+        if not self.claim(url):
+            return False
+        with self._claims_lock:
+            if not self._stopped:
+                self._claimed.add(url)
+                return True
+        # The run ended while this claim was being made
+        self.on_failed(url)
+        return False
+
+    def _release(self, url):
+        with self._claims_lock:
+            self._claimed.discard(url)
+        self.on_failed(url)
+
+    async def _finish(self, queue, consumers):
+        for _ in consumers:
+            await queue.put(_DONE)
+        await asyncio.gather(*consumers)
+
+    def _limit_reached(self):
+        return self.limit is not None and self.discovered >= self.limit
+
+    async def _queue(self, urls, url):
+        self.discovered += 1
+        self._seen.add(url)
+        await urls.put((self.discovered, url))
+
+    async def _discover(self, urls):
+        journal = self.journal
+        if journal is not None:
+            # Finish what an interrupted run had already found first
+            for url in journal.pending:
+                if self._limit_reached():
+                    return
+                await self._queue(urls, url)
+            self._seen.update(journal.done)
+            if journal.discovery_complete:
+                return
+
+        loop = asyncio.get_running_loop()
+        page_iter = self.discover()
+        try:
+            while not self._limit_reached():
+                if self.checkpoint is not None:
+                    await self.checkpoint()
+                # next() blocks on the browser, so pull pages off the loop thread
+                page_urls = await loop.run_in_executor(None, next, page_iter, None)
+                if page_urls is None:
+                    if journal is not None:
+                        journal.record_discovery_complete()
+                    break
+                for url in page_urls:
+                    if self._limit_reached():
+                        break
+                    if url in self._seen:
+                        continue
+                    if self.claim is not None and not await loop.run_in_executor(None, self._claim, url):
+                        self._seen.add(url)
+                        self.skipped += 1
+                        self.metrics.count("dedup.business_skipped")
+                        continue
+                    if journal is not None:
+                        journal.record_discovered(url)
+                    await self._queue(urls, url)
+                self.on_progress(self.processed, self.discovered)
+        finally:
+            # Stops any result pages still loading once the limit is reached
+            close = getattr(page_iter, 'close', None)
+            if close is not None:
+                await loop.run_in_executor(None, close)
+
+    async def _fetch(self, urls, pages):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await urls.get()
+            if item is _DONE:
+                return
+            number, url = item
+            if self.checkpoint is not None:
+                await self.checkpoint()
+            self.on_status(f"Processing business {number}...")
+            try:
+                html = await loop.run_in_executor(self.fetch_executor, self._fetch_page, url)
+            except Exception as e:
+                self.metrics.count("business.error", stage="fetch")
+                self._release(url)
+                self._business_done(f"Error processing business {number}: {str(e)}")
+                continue
+            await pages.put((number, url, html))
+
+    async def _extract(self, pages, rows):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await pages.get()
+            if item is _DONE:
+                return
+            number, url, html = item
+            try:
+                # Parsing is CPU-bound; keep the event loop free for other stages
+                profile = await loop.run_in_executor(None, self._parse, html) if html is not None else None
+                people = None
+                if self.refresh is not None:
+                    people = await loop.run_in_executor(None, self.refresh.reuse, url, profile)
+                if people is None:
+                    people = await self.enrich(profile)
+                    if isinstance(people, IncompleteRows):
+                        self.metrics.count("business.incomplete")
+                    elif self.refresh is not None:
+                        await loop.run_in_executor(None, self.refresh.record, url, profile, people)
+            except Exception as e:
+                self.metrics.count("business.error", stage="extract")
+                self._release(url)
+                self._business_done(f"Error processing business {number}: {str(e)}")
+                continue
+            for person in people:
+                await rows.put(person)
+            # Marks the business done only after the sink has its rows
+            await rows.put(_BusinessDone(url))
+            if people:
+                self._business_done(f"Found {len(people)} people from business {number}")
+            else:
+                self._business_done(f"No people found for business {number}")
+
+    async def _sink(self, rows):
+        while True:
+            row = await rows.get()
+            if row is _DONE:
+                with self.metrics.stage("csv_write"):
+                    self.sink.flush()
+                return
+            if isinstance(row, _BusinessDone):
+                if self.journal is not None:
+                    with self.metrics.stage("csv_write"):
+                        self.sink.flush()
+                    self.journal.record_done(row.url)
+                with self._claims_lock:
+                    self._claimed.discard(row.url)
+                self.on_done(row.url)
+                continue
+            with self.metrics.stage("csv_write"):
+                written = self.sink.write(row)
+            if written:
+                self.rows += 1
+                if self.journal is not None:
+                    self.journal.record_row()
+                self.on_row(row)
+
+    def _fetch_page(self, url):
+        with self.metrics.stage("fetch_profile"):
+            return self.fetch_page(url)
+
+    def _parse(self, html):
+        with self.metrics.stage("parse_profile"):
+            return extract_profile(html)
+
+    def _business_done(self, message):
+        self.processed += 1
+        self.on_status(message)
+        self.on_progress(self.processed, self.discovered)
@@ -0,0 +1,132 @@
+"""Single-pass extraction of the fields we read from a BBB business profile page."""
+import importlib.util
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+CONTACT_SECTION_HEADING = "Additional Contact Information"
+CONTACT_LABELS = ("Principal Contacts", "Customer Contacts")
+START_DATE_LABEL = "Business Started:"
+
+
+def _available_backends():
+    # find_spec only looks the modules up, so importing this file stays cheap
+    backends = []
+    if importlib.util.find_spec("selectolax") is not None:
+        backends.append("selectolax")
+    if importlib.util.find_spec("lxml") is not None:
+        backends.append("lxml")
+    backends.append("html.parser")
+    return backends
+
+
+BACKENDS = _available_backends()
+DEFAULT_BACKEND = BACKENDS[0]
+
+
+@dataclass
+class BusinessProfile:
+    """Everything the scraper needs from one BBB profile page."""
+    name: Optional[str] = None
+    address: Optional[str] = None
+    start_date: Optional[str] = None
+    owners: List[str] = field(default_factory=list)
+    # Only filled in when no owners are listed, for the LLM fallback
+    page_text: Optional[str] = None
+
+    def owner_title(self):
+        """Owners in the legacy ``{"owner0": ..., "owner1": ...}`` shape, or None."""
+        if self.owners:
+            return {f"owner{idx}": owner for idx, owner in enumerate(self.owners)}
+        return None
+
+
+def extract_profile(html, backend=None):
+    """Parse ``html`` once and pull out every profile field.
+
+    ``backend`` is one of ``BACKENDS``; by default the fastest installed one
+    is used (selectolax, then lxml, then the stdlib ``html.parser``).
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend == "selectolax":
+        return _extract_selectolax(html)
+    if backend not in ("lxml", "html.parser"):
+        raise ValueError(f"Unknown HTML backend: {backend}")
+    return _extract_bs4(html, backend)
+
+
+def _extract_bs4(html, parser):
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, parser)
+    profile = BusinessProfile()
+
+    name = soup.find('span', {"id": 'businessName'})
+    if name is not None:
+        profile.name = name.text
+    address = soup.find('div', class_='bpr-overview-address')
+    if address is not None:
+        profile.address = address.text
+
+    for div in soup.find_all('div', {"class": 'bpr-details-dl-data'}):
+        if START_DATE_LABEL in div.text:
+            dd = div.find('dd')
+            profile.start_date = dd.text if dd is not None else None
+
+    for section in soup.find_all("div", class_="bpr-details-section stack"):
+        heading = section.find("h3", class_="bds-body bpr-details-section-heading")
+        if not heading or CONTACT_SECTION_HEADING not in heading.text:
+            continue
+        dl = section.find("dl", class_="bpr-details-dl stack")
+        if not dl:
+            continue
+        for div_data in dl.find_all("div", class_="bpr-details-dl-data"):
+            dt = div_data.find("dt")
+            if dt and dt.text.strip() in CONTACT_LABELS:
+                for dd in div_data.find_all("dd"):
+                    profile.owners.append(dd.get_text(separator=" ", strip=True))
+
+    if not profile.owners:
+        profile.page_text = soup.get_text(separator='\n', strip=True)
+    return profile
+
+
+def _extract_selectolax(html):
+    try:
+        from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    except ImportError:  # selectolax < 0.3.13 only ships the Modest backend
+        from selectolax.parser import HTMLParser
+
+    tree = HTMLParser(html)
+    profile = BusinessProfile()
+
+    name = tree.css_first('span#businessName')
+    if name is not None:
+        profile.name = name.text()
+    address = tree.css_first('div.bpr-overview-address')
+    if address is not None:
+        profile.address = address.text()
+
+    for div in tree.css('div.bpr-details-dl-data'):
+        if START_DATE_LABEL in div.text():
+            dd = div.css_first('dd')
+            profile.start_date = dd.text() if dd is not None else None
+
+    for section in tree.css('div.bpr-details-section.stack'):
+        heading = section.css_first('h3.bds-body.bpr-details-section-heading')
+        if heading is None or CONTACT_SECTION_HEADING not in heading.text():
+            continue
+        dl = section.css_first('dl.bpr-details-dl.stack')
+        if dl is None:
+            continue
+        for div_data in dl.css('div.bpr-details-dl-data'):
+            dt = div_data.css_first('dt')
+            if dt is not None and dt.text().strip() in CONTACT_LABELS:
+                for dd in div_data.css('dd'):
+                    profile.owners.append(dd.text(separator=" ", strip=True))
+
+    if not profile.owners:
+        tree.strip_tags(['script', 'style', 'noscript'])
+        text = tree.root.text(separator='\n', strip=True) if tree.root is not None else ""
+        # Match bs4's get_text(strip=True), which drops whitespace-only strings
+        profile.page_text = '\n'.join(line for line in text.split('\n') if line)
+    return profile
@@ -0,0 +1,85 @@
+"""Typed result rows.
+
+A ``PersonRecord`` keeps phones and emails as lists instead of spreading
+them over ``Phone 0``..``Phone n`` / ``Email 0``..``Email n`` keys, and uses
+``__slots__`` so a long run holding many of them stays small. ``to_row()``
+and ``from_row()`` convert to and from the flat CSV layout.
+"""
+
+# Record attribute -> CSV column, in output order
+FIELDS = {
+    "name": "Name",
+    "age": "Age",
+    "position": "Position",
+    "address": "Address",
+    "city": "City",
+    "state": "State",
+    "business_name": "Business Name",
+    "business_start_date": "Business Start Date",
+}
+MULTI_FIELDS = {"phones": "Phone", "emails": "Email"}
+
+
+class PersonRecord:
+    __slots__ = tuple(FIELDS) + tuple(MULTI_FIELDS)
+
+    def __init__(self, name="", age="", position=None, address="", city="", state="", business_name="",
+                 business_start_date=None, phones=(), emails=()):
+        self.name = name
+        self.age = age
+        self.position = position
+        self.address = address
+        self.city = city
+        self.state = state
+        self.business_name = business_name
+        self.business_start_date = business_start_date
+        self.phones = list(phones)
+        self.emails = list(emails)
+
+    @classmethod
+    def from_row(cls, row):
+        """Build a record from a flat row (``Name``, ..., ``Phone 0``, ``Email 0``, ...)."""
+        record = cls(**{attr: row.get(column) or None for attr, column in FIELDS.items()})
+        for attr, prefix in MULTI_FIELDS.items():
+            values = []
+            i = 0
+            while f"{prefix} {i}" in row:
+                if row[f"{prefix} {i}"]:
+                    values.append(row[f"{prefix} {i}"])
+                i += 1
+            setattr(record, attr, values)
+        return record
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{attr: data.get(attr) for attr in cls.__slots__ if attr in data})
+
+    def to_row(self, max_phones=None, max_emails=None):
+        """Flat row in the CSV layout, optionally keeping only the first few phones/emails."""
+        row = {column: getattr(self, attr) for attr, column in FIELDS.items()}
+        row.update({f"Phone {i}": phone for i, phone in enumerate(self.phones[:max_phones])})
+        row.update({f"Email {i}": email for i, email in enumerate(self.emails[:max_emails])})
+        return row
+
+    def as_dict(self):
+        return {attr: getattr(self, attr) for attr in self.__slots__}
+
+    def key(self):
+        """Identity used for de-duplication: every field, with empty values normalized."""
+        # Emails come out of a set, so their order carries no meaning
+        return (tuple(str(getattr(self, attr) or "") for attr in FIELDS)
+                + (tuple(self.phones), tuple(sorted(self.emails))))
+
+    def __eq__(self, other):
+        if not isinstance(other, PersonRecord):
+            return NotImplemented
+        return self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __repr__(self):
+        return f"PersonRecord({self.name!r}, {self.business_name!r}, phones={len(self.phones)}, emails={len(self.emails)})"
+
+    def __str__(self):
+        return str(self.to_row())
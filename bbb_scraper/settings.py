@@ -0,0 +1,36 @@
+"""``Settings`` for a run, kept apart from the engine so the GUI can build one without importing it."""
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class Settings:
+    """Knobs for one run."""
+    # How many Chrome sessions may run at once, and how many pages each one
+    # serves before it is restarted
+    browser_pool_size: int = 2
+    pages_per_browser: int = 50
+    headless: bool = True
+    # Businesses processed at once, and outbound HTTP calls in flight
+    business_concurrency: int = 4
+    http_concurrency: int = 8
+    # Per-request timeout and retries for scrape.do and the LLM; per-host
+    # rate limits live in bbb_scraper.transport.HOST_LIMITS
+    http_timeout: float = 30.0
+    http_retries: int = 3
+    # Search results pages are loaded in parallel, but no faster than this
+    search_pages_per_second: float = 1.0
+    # Owner lookups sent to the local LLM at once, and profiles asked about
+    # per prompt (1 = one prompt per profile)
+    llm_concurrency: int = 2
+    llm_batch_size: int = 1
+    # Try a plain HTTP GET for BBB pages before loading them in a browser
+    http_fast_path: bool = True
+    # Stop after this many businesses (None = every search result)
+    max_businesses: Optional[int] = None
+    # JSON-lines file receiving every stage timing and counter (None = off)
+    trace_path: Optional[str] = None
+    # "cprofile" or "pyinstrument" to profile the run; the report is written
+    # to profile_path (default: next to the output CSV)
+    profiler: Optional[str] = None
+    profile_path: Optional[str] = None
@@ -0,0 +1,174 @@
+"""SQLite result store: typed rows, de-duplicated on insert, exportable to CSV or Parquet.
+
+    with ResultStore("people.sqlite3") as store:
+        store.write(record)          # False if an identical record is already stored
+    ResultStore("people.sqlite3", append=True).export_csv("people.csv")
+
+or from the shell: ``python -m bbb_scraper.store people.sqlite3 people.csv``.
+
+Phones and emails are stored as JSON arrays, so a person with eleven phone
+numbers keeps all eleven. The CSV export widens to the longest list; the
+Parquet export (needs ``pyarrow``) keeps them as list columns.
+"""
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from .records import FIELDS, MULTI_FIELDS, PersonRecord
+
+_COLUMNS = list(FIELDS) + list(MULTI_FIELDS)
+
+
+def record_key(record):
+    return hashlib.sha1(json.dumps(record.key()).encode("utf-8")).hexdigest()
+
+
+class ResultStore:
+    """Append people to a SQLite table keyed by their identity; same interface as ``CsvSink``."""
+
+    def __init__(self, path, append=False):
+        self.path = path
+        self.written = 0
+        if not append and os.path.exists(path):
+            os.remove(path)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS people (key TEXT PRIMARY KEY, "
+            + ", ".join(f"{column} TEXT" for column in _COLUMNS)
+            + ", added_at REAL)")
+        self._lock = threading.Lock()
+
+    def write(self, record):
+        """Insert ``record`` unless an identical one is stored. Returns True if inserted."""
+        values = [getattr(record, attr) for attr in FIELDS]
+        values += [json.dumps(getattr(record, attr)) for attr in MULTI_FIELDS]
+        with self._lock:
+            cursor = self._db.execute(
+                f"INSERT OR IGNORE INTO people (key, {', '.join(_COLUMNS)}, added_at) "
+                f"VALUES ({', '.join('?' * (len(_COLUMNS) + 2))})",
+                [record_key(record)] + values + [time.time()])
+        if cursor.rowcount == 1:
+            self.written += 1
+            return True
+        return False
+
+    def flush(self):
+        with self._lock:
+            self._db.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM people").fetchone()[0]
+
+    def records(self, batch_size=1000):
+        """Every stored record, in insertion order."""
+        last = 0
+        while True:
+            with self._lock:
+                rows = self._db.execute(
+                    f"SELECT rowid, {', '.join(_COLUMNS)} FROM people WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last, batch_size)).fetchall()
+            if not rows:
+                return
+            for rowid, *values in rows:
+                data = dict(zip(_COLUMNS, values))
+                for attr in MULTI_FIELDS:
+                    data[attr] = json.loads(data[attr] or "[]")
+                yield PersonRecord.from_dict(data)
+            last = rows[-1][0]
+
+    def export_csv(self, path, max_phones=None, max_emails=None):
+        """Write the flat ``Phone i``/``Email i`` CSV layout; returns the number of rows."""
+        self.flush()
+        with self._lock:
+            phones, emails = self._db.execute(
+                "SELECT MAX(json_array_length(phones)), MAX(json_array_length(emails)) FROM people").fetchone()
+        phones = min(phones or 0, max_phones) if max_phones is not None else phones or 0
+        emails = min(emails or 0, max_emails) if max_emails is not None else emails or 0
+        columns = (list(FIELDS.values())
+                   + [f"Phone {i}" for i in range(phones)]
+                   + [f"Email {i}" for i in range(emails)])
+        count = 0
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+            writer.writeheader()
+            for record in self.records():
+                writer.writerow(record.to_row(phones, emails))
+                count += 1
+        return count
+
+    def export_parquet(self, path, batch_size=10000):
+        """Write a Parquet file with list columns for phones and emails; needs ``pyarrow``."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet export needs pyarrow: pip install pyarrow") from None
+
+        self.flush()
+        schema = pa.schema([(attr, pa.string()) for attr in FIELDS]
+                           + [(attr, pa.list_(pa.string())) for attr in MULTI_FIELDS])
+        count = 0
+        with pq.ParquetWriter(path, schema) as writer:
+            batch = []
+            for record in self.records(batch_size):
+                batch.append(record.as_dict())
+                if len(batch) >= batch_size:
+                    writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                    count += len(batch)
+                    batch = []
+            if batch or not count:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                count += len(batch)
+        return count
+
+    def close(self):
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ParquetSink(ResultStore):
+    """Collect rows in a SQLite staging file next to ``path``, then write ``path`` as Parquet on close."""
+
+    def __init__(self, path, append=False):
+        import pyarrow  # noqa: F401  (fail before the run, not after it)
+
+        self.parquet_path = path
+        super().__init__(path + ".sqlite3", append=append)
+
+    def close(self):
+        self.export_parquet(self.parquet_path)
+        super().close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m bbb_scraper.store",
+                                     description="Export a result store to CSV or Parquet.")
+    parser.add_argument("store", help="SQLite result store written by a run")
+    parser.add_argument("output", help="file to write; .parquet writes Parquet, anything else CSV")
+    args = parser.parse_args(argv)
+    if not os.path.exists(args.store):
+        parser.error(f"No result store at {args.store}")
+    with ResultStore(args.store, append=True) as store:
+        if args.output.lower().endswith(".parquet"):
+            count = store.export_parquet(args.output)
+        else:
+            count = store.export_csv(args.output)
+    print(f"Exported {count} rows to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
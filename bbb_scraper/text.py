@@ -0,0 +1,45 @@
+"""Name, title and email normalization with the patterns compiled once.
+
+``clean_names`` and ``split_contacts`` are plain loops over
+``clean_name`` and ``split_contact``, for callers holding a list.
+"""
+import re
+
+HONORIFIC_RE = re.compile(r"\b(Mr|Ms|Mrs|Dr|Prof)\.?\s+", re.IGNORECASE)
+EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
+
+def clean_name(text):
+    """Drop honorifics and collapse whitespace: ``"Mr.  John Smith "`` -> ``"John Smith"``."""
+    return " ".join(HONORIFIC_RE.sub("", text).split())
+
+
+def clean_names(values):
+    """``[clean_name(value) for value in values]``."""
+    return [clean_name(value) for value in values]
+
+
+def split_contact(owner):
+    """``"Mr. John Smith, Owner"`` -> ``("John Smith", "Owner")``; the title is None without a comma."""
+    parts = owner.split(",")
+    return clean_name(parts[0]), parts[-1].strip() if len(parts) > 1 else None
+
+
+def split_contacts(owners):
+    """``[split_contact(owner) for owner in owners]``: ``(name, title)`` pairs."""
+    return [split_contact(owner) for owner in owners]
+
+
+def find_emails(node):
+    """Unique email addresses in the text under a BeautifulSoup ``node``, in page order.
+
+    Only text nodes containing an ``@`` are scanned, instead of the whole
+    page text joined into one string.
+    """
+    emails = {}
+    for child in node.descendants:
+        # Tags are not strings; text nodes (NavigableString) are
+        if isinstance(child, str) and "@" in child:
+            for email in EMAIL_RE.findall(child):
+                emails[email] = None
+    return list(emails)
@@ -0,0 +1,220 @@
+"""Shared HTTP transport for every outbound request (scrape.do, the local LLM).
+
+One pooled ``requests.Session`` keeps connections alive between calls. Each
+host gets its own token bucket (``HOST_LIMITS``) and circuit breaker, every
+request has a timeout, and connection errors, timeouts, 429s and 5xx
+answers are retried with exponential backoff and full jitter.
+"""
+import copy
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import urlsplit
+
+from .metrics import Metrics
+from .ratelimit import RateLimiter
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class HostLimit:
+    """Requests per second (None = unlimited) and how many may go out back to back."""
+    rate: Optional[float] = None
+    burst: int = 1
+
+
+# scrape.do limits depend on the plan; 5/s with bursts of 5 stays inside the
+# smaller ones. Raise it to match yours.
+HOST_LIMITS = {
+    "api.scrape.do": HostLimit(rate=5.0, burst=5),
+    # Plain GETs of BBB pages (bbb_scraper.fetch); keep them polite
+    "www.bbb.org": HostLimit(rate=4.0, burst=4),
+}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a host that has been failing."""
+
+
+class CircuitBreaker:
+    """Open after ``failures`` failed requests in a row; let one through again after ``reset_after`` seconds."""
+
+    def __init__(self, failures=5, reset_after=30.0):
+        self.failures = failures
+        self.reset_after = reset_after
+        self._failed = 0
+        self._opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        return self._opened_at is not None
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial or time.monotonic() - self._opened_at < self.reset_after:
+                return False
+            # Half open: one request decides whether the host is back
+            self._trial = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failed = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failed += 1
+            if self._trial or self._failed >= self.failures:
+                self._opened_at = time.monotonic()
+            self._trial = False
+
+
+class Transport:
+    """Rate limited, retrying, circuit-broken HTTP with pooled keep-alive connections.
+
+    ``get``/``post`` take the usual ``requests`` keyword arguments and return
+    the final response; the caller decides what a bad status means. Only
+    transport errors (after the last retry) and ``CircuitOpenError`` raise.
+    """
+
+    def __init__(self, limits=None, timeout=30.0, retries=3, backoff=0.5, max_backoff=30.0, pool_size=16,
+                 breaker_failures=5, breaker_reset=30.0, metrics=None):
+        self.limits = dict(HOST_LIMITS if limits is None else limits)
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.pool_size = pool_size
+        self.breaker_failures = breaker_failures
+        self.breaker_reset = breaker_reset
+        self.metrics = metrics or Metrics()
+        self._session = None
+        self._limiters = {}
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method, url, stage="http", retries=None, **kwargs):
+        """Send one request, retrying what is worth retrying.
+
+        ``stage`` names the metrics timer (None = untimed); ``retries``
+        overrides the transport's retry count for this call.
+        """
+        import requests
+
+        if retries is None:
+            retries = self.retries
+
+        host = urlsplit(url).hostname or ""
+        limiter, breaker = self._host(host)
+        kwargs.setdefault("timeout", self.timeout)
+        session = self._http()
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                self.metrics.count("http.circuit_open", host=host)
+                raise CircuitOpenError(f"{host} failed {self.breaker_failures} times in a row; "
+                                       f"not calling it for {self.breaker_reset:.0f}s")
+            if limiter is not None:
+                limiter.acquire()
+            response = error = None
+            try:
+                if stage:
+                    with self.metrics.stage(stage, host=host):
+                        response = session.request(method, url, **kwargs)
+                else:
+                    response = session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            except Exception:
+                # Not worth retrying (a broken chunked body, too many
+                # redirects, ...), but it still counts against the host and
+                # must end a half-open trial, or the circuit never closes
+                breaker.record_failure()
+                raise
+            if error is None and response.status_code not in RETRY_STATUSES:
+                breaker.record_success()
+                return response
+            breaker.record_failure()
+            if attempt >= retries:
+                self.metrics.count("http.gave_up", host=host)
+                if error is not None:
+                    raise error
+                return response
+            delay = self._delay(attempt, response)
+            if response is not None:
+                response.close()
+            attempt += 1
+            self.metrics.count("http.retry", host=host, attempt=attempt,
+                               reason=type(error).__name__ if error is not None else response.status_code)
+            time.sleep(delay)
+
+    def _delay(self, attempt, response):
+        # Full jitter: anywhere between 0 and the exponential ceiling, so
+        # retries from many threads do not arrive together
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(self.max_backoff, float(retry_after)))
+        return delay
+
+    def _host(self, host):
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(self.breaker_failures, self.breaker_reset)
+                limit = self.limits.get(host)
+                if limit is not None and limit.rate:
+                    self._limiters[host] = RateLimiter(limit.rate, burst=limit.burst)
+            return self._limiters.get(host), breaker
+
+    def _http(self):
+        with self._lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+
+    def with_metrics(self, metrics):
+        """This transport, timing into ``metrics``; connections, rate limits and circuit breakers stay shared.
+
+        Lets several scrapers (the jobs of a ``JobScheduler``) keep their own
+        stats while staying inside one set of per-host limits.
+        """
+        # Created now so the view and this transport use the same session
+        self._http()
+        view = copy.copy(self)
+        view.metrics = metrics
+        return view
+
+    def close(self):
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
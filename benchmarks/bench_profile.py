@@ -0,0 +1,79 @@
+"""Compare the old one-parse-per-field extraction with ``extract_profile``.
+
+Run from the repo root:
+
+    python benchmarks/bench_profile.py [--repeat 20]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from bbb_scraper.profile import BACKENDS, extract_profile  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def legacy_four_pass(html):
+    """What crawl_bbb_business + run_demo used to do: one soup per field."""
+    soup = BeautifulSoup(html, "html.parser")
+    owners = []
+    for section in soup.find_all("div", class_="bpr-details-section stack"):
+        heading = section.find("h3", class_="bds-body bpr-details-section-heading")
+        if heading and "Additional Contact Information" in heading.text:
+            dl = section.find("dl", class_="bpr-details-dl stack")
+            if not dl:
+                continue
+            for div_data in dl.find_all("div", class_="bpr-details-dl-data"):
+                dt = div_data.find("dt")
+                if dt and dt.text.strip() in ["Principal Contacts", "Customer Contacts"]:
+                    owners.extend(dd.get_text(separator=" ", strip=True) for dd in div_data.find_all("dd"))
+    address = BeautifulSoup(html, "html.parser").find('div', class_='bpr-overview-address').text
+    name = BeautifulSoup(html, "html.parser").find('span', {"id": 'businessName'}).text
+    start_date = None
+    for div in BeautifulSoup(html, "html.parser").find_all('div', {"class": 'bpr-details-dl-data'}):
+        if "Business Started:" in div.text:
+            start_date = div.find('dd').text
+    page_text = None
+    if not owners:
+        page_text = BeautifulSoup(html, 'html.parser').get_text(separator='\n', strip=True)
+    return name, address, start_date, owners, page_text
+
+
+def timeit(func, pages, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            func(html)
+    elapsed = time.perf_counter() - start
+    return elapsed, repeat * len(pages) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--fixtures", default=os.path.join(FIXTURES, "profile_*.html"))
+    args = parser.parse_args()
+
+    pages = []
+    for path in sorted(glob.glob(args.fixtures)):
+        with open(path, encoding="utf-8") as f:
+            pages.append(f.read())
+    if not pages:
+        sys.exit(f"No fixtures match {args.fixtures}")
+
+    print(f"{len(pages)} pages x {args.repeat} repeats")
+    legacy, legacy_rate = timeit(legacy_four_pass, pages, args.repeat)
+    print(f"{'legacy (5x html.parser)':<26} {legacy:8.3f}s {legacy_rate:9.1f} pages/s")
+    for backend in BACKENDS:
+        elapsed, rate = timeit(lambda html: extract_profile(html, backend), pages, args.repeat)
+        print(f"{'extract_profile/' + backend:<26} {elapsed:8.3f}s {rate:9.1f} pages/s  {legacy / elapsed:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+"""Offline benchmark suite: the parsing helpers and the full flow, on saved pages.
+
+Nothing touches the network. Parsers run on the fixtures in
+``benchmarks/fixtures/``; the end-to-end cases point the scraper at a local
+fake of bbb.org, scrape.do and the LLM (see ``fakeserver.py``). Run from the repo root:
+
+    python benchmarks/bench_suite.py                    # print the table
+    python benchmarks/bench_suite.py --save-baseline    # record benchmarks/baseline.json
+    python benchmarks/bench_suite.py --compare          # fail on a slowdown against it
+
+Each case reports throughput, peak traced memory and the number of memory
+blocks still allocated when the case returns (tracemalloc, measured on a
+separate pass so tracing does not skew the timings).
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from bbb_scraper.engine import (Scraper, Settings, get_address, get_business_name,  # noqa: E402
+                                get_start_year, parse_owner_title_from_html)
+from bbb_scraper.llm import OwnerExtractor  # noqa: E402
+from bbb_scraper.output import CsvSink  # noqa: E402
+from bbb_scraper.profile import extract_profile  # noqa: E402
+from bbb_scraper.records import PersonRecord  # noqa: E402
+from bbb_scraper.store import ResultStore  # noqa: E402
+from bbb_scraper.text import clean_names, split_contacts  # noqa: E402
+from fakeserver import FakeServer, HttpPool, load_fixture  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+NAMES = ["Mr. John  Smith", "dr Jane Doe", "Ms.   Ann Lee-Park", "Prof. A. B. Carter", "Robert Brown"]
+# Owner strings as the LLM and the profile parser return them
+CONTACTS = ["Mr. John  Smith, Owner", "dr Jane Doe, President", "Ms.   Ann Lee-Park", "Prof. A. B. Carter, CEO"]
+OWNERS = ["Ann Lee", "Bob Ray", "Cy Dee", "Di Eve", "Ed Fox", "Fay Gus", "Gil Hart", "Hal Ives"]
+# Seconds the fake LLM "thinks" per prompt
+LLM_DELAY = 0.05
+
+
+def parser_cases(scraper):
+    search = load_fixture("search_results.html")
+    profiles = [load_fixture("profile_owner.html"), load_fixture("profile_no_owner.html")]
+    person = BeautifulSoup(load_fixture("tps_person.html"), "html.parser")
+    # 1,000 values for the list text helpers
+    names = NAMES * 200
+    contacts = CONTACTS * 250
+
+    return [
+        ("get_business_urls", "pages", [search], scraper.get_business_urls),
+        ("parse_owner_title_from_html", "pages", profiles, parse_owner_title_from_html),
+        ("get_address", "pages", profiles, get_address),
+        ("get_business_name", "pages", profiles, get_business_name),
+        ("get_start_year", "pages", profiles, get_start_year),
+        ("clean_text", "names", NAMES, scraper.clean_text),
+        ("extract_emails", "pages", [person], scraper.extract_emails),
+        ("clean_names", "1k-names", [names], clean_names),
+        ("split_contacts", "1k-names", [contacts], split_contacts),
+    ]
+
+
+def sink_cases():
+    # 1000 people, every one written twice so half the writes are duplicates
+    records = [PersonRecord(name=f"Person {i}", age=str(30 + i % 40), position="Owner", address=f"{i} Main St",
+                            city="Las Vegas", state="NV", business_name=f"Business {i // 3}",
+                            business_start_date="1/1/2010", phones=[f"(702) 555-{i:04d}"],
+                            emails=[f"person{i}@example.com"])
+               for i in range(1000)] * 2
+
+    def write_all(open_sink):
+        def run(_):
+            with tempfile.TemporaryDirectory() as tmp, open_sink(tmp) as sink:
+                for record in records:
+                    sink.write(record)
+        return run
+
+    return [
+        ("csv_sink", "runs", [None], write_all(lambda tmp: CsvSink(os.path.join(tmp, "people.csv")))),
+        ("result_store", "runs", [None], write_all(lambda tmp: ResultStore(os.path.join(tmp, "people.sqlite3")))),
+    ]
+
+
+def flow_cases(scraper, server, businesses):
+    urls = [f"{server.url}/us/nv/las-vegas/profile/plumber/business-{i}" for i in range(1, businesses + 1)]
+    pool = HttpPool()
+
+    def run_demo(url):
+        with ThreadPoolExecutor(max_workers=pool.size) as executor:
+            return asyncio.run(scraper.run_demo(url, "token", pool, executor))
+
+    def pipeline(_):
+        # A search page on the fake server lists 15 businesses over 3 pages
+        with tempfile.TemporaryDirectory() as tmp, \
+                ThreadPoolExecutor(max_workers=pool.size) as executor:
+            return asyncio.run(scraper.run_async("plumber", "Las Vegas", pool, executor,
+                                                 os.path.join(tmp, "people.csv")))
+
+    # One round asks about 8 distinct profiles without a listed owner, so
+    # the memo does not hide the LLM
+    page_text = extract_profile(load_fixture("profile_no_owner.html")).page_text
+    texts = [page_text.replace("Maria Lopez", owner) for owner in OWNERS]
+
+    def llm_owners(batch_size):
+        def run(_):
+            extractor = OwnerExtractor(scraper.llm_chat_url, concurrency=2, batch_size=batch_size)
+
+            async def ask_all():
+                return await asyncio.gather(*(extractor.extract_async(text) for text in texts))
+
+            try:
+                return asyncio.run(ask_all())
+            finally:
+                extractor.close()
+        return run
+
+    return [
+        ("run_demo", "businesses", urls, run_demo),
+        ("pipeline", "runs", [None], pipeline),
+        ("llm_owner", "rounds", [None], llm_owners(1)),
+        ("llm_owner_batched", "rounds", [None], llm_owners(4)),
+    ]
+
+
+def measure(func, items, repeat):
+    func(items[0])  # warm up imports and caches
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            func(item)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for item in items:
+        func(item)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return {"rate": repeat * len(items) / elapsed, "peak_kib": peak / 1024, "blocks": blocks}
+
+
+def compare(results, baseline, tolerance):
+    """Print the change against the baseline; return the names that got slower."""
+    slower = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            print(f"{name:<28} (no baseline)")
+            continue
+        change = result["rate"] / base["rate"] - 1
+        flag = ""
+        if change < -tolerance:
+            slower.append(name)
+            flag = "  SLOWER"
+        print(f"{name:<28} {base['rate']:10.1f} -> {result['rate']:10.1f} {result['unit']}/s {change:+7.1%}"
+              f"   peak {base['peak_kib']:8.1f} -> {result['peak_kib']:8.1f} KiB{flag}")
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="timed passes over the parser fixtures")
+    parser.add_argument("--businesses", type=int, default=10, help="businesses per run_demo pass")
+    parser.add_argument("--only", nargs="*", help="run only these cases")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="exit 1 if a case is slower than the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown before failing (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    scraper = Scraper("token", Settings(search_pages_per_second=1000), page_cache=None)
+    results = {}
+    with FakeServer(llm_delay=LLM_DELAY) as server:
+        # Nothing below may leave localhost
+        scraper.bbb_base_url = server.url
+        scraper.scrapedo_api_url = server.url + "/scrapedo"
+        scraper.llm_chat_url = server.url + "/api/chat"
+
+        cases = [(name, unit, items, func, args.repeat) for name, unit, items, func in parser_cases(scraper)]
+        cases += [(name, unit, items, func, 5) for name, unit, items, func in sink_cases()]
+        cases += [(name, unit, items, func, 1) for name, unit, items, func in flow_cases(scraper, server, args.businesses)]
+        for name, unit, items, func, repeat in cases:
+            if args.only and name not in args.only:
+                continue
+            result = measure(func, items, repeat)
+            result["unit"] = unit
+            results[name] = result
+            print(f"{name:<28} {result['rate']:10.1f} {unit}/s   peak {result['peak_kib']:8.1f} KiB"
+                  f"   {result['blocks']:+7d} blocks", flush=True)
+        print(f"fake server answered {server.requests} requests")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline saved to {args.baseline}")
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            sys.exit(f"No baseline at {args.baseline}; run with --save-baseline first")
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print()
+        slower = compare(results, baseline, args.tolerance)
+        if slower:
+            print(f"Slower than the baseline: {', '.join(slower)}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""Local stand-in for bbb.org, the scrape.do API and a local LLM, serving the saved fixtures.
+
+    with FakeServer() as server:
+        scraper.bbb_base_url = server.url
+        scraper.scrapedo_api_url = server.url + "/scrapedo"
+        scraper.llm_chat_url = server.url + "/api/chat"
+
+``HttpPool`` stands in for the browser pool, loading pages with plain GETs.
+
+The LLM stub answers like Ollama's streaming ``/api/chat``. It "extracts" the
+first ``owner <First Last>, <Title>`` phrase of each profile in the prompt,
+after sleeping ``llm_delay`` seconds to stand in for inference time.
+
+Tests can break things on purpose: while ``scrapedo_down`` is set, scrape.do
+answers 503, and ``llm_batch_drop`` leaves the last profile out of every
+batched LLM answer. With ``owners_listed=False`` no profile names its owner,
+so every business goes to the LLM.
+"""
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle on, a kept-alive
+    # connection stalls on the client's delayed ACK for every response
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        pages = self.server.pages
+        if url.path == "/search":
+            body = pages["search_results.html"]
+        elif "/profile/" in url.path:
+            # Some businesses list no owner, which sends run_demo down the LLM path
+            listed = self.server.owners_listed and not url.path.endswith("0")
+            body = pages["profile_owner.html" if listed else "profile_no_owner.html"]
+            if not self.server.owners_listed:
+                # A different text per business, so the LLM memo answers none of them
+                body = body.replace("Founded by our owner", f"Listing {url.path.rsplit('-', 1)[-1]}. Founded by our owner")
+        elif url.path == "/scrapedo":
+            if self.server.scrapedo_down:
+                self._reply(503, "text/plain", "unavailable")
+                return
+            target = urlparse(parse_qs(url.query).get("url", [""])[0])
+            body = pages["tps_person.html"] if target.path.startswith("/find/person/") else pages["tps_results.html"]
+        else:
+            self._reply(404, "text/plain", "not found")
+            return
+        self._reply(200, "text/html; charset=utf-8", body)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if urlparse(self.path).path != "/api/chat":
+            self._reply(404, "text/plain", "not found")
+            return
+        prompt = json.loads(body)["messages"][0]["content"]
+        self.server.llm_prompts.append(prompt)
+        time.sleep(self.server.llm_delay)
+        answer = _llm_answer(prompt, drop_last=self.server.llm_batch_drop)
+        # Streamed in a few chunks, one JSON object per line
+        chunks = [answer[i:i + 16] for i in range(0, len(answer), 16)]
+        lines = [json.dumps({"message": {"role": "assistant", "content": chunk}, "done": False}) for chunk in chunks]
+        lines.append(json.dumps({"done": True}))
+        self._reply(200, "application/x-ndjson", "\n".join(lines) + "\n")
+
+    def _reply(self, status, content_type, body):
+        self.server.requests += 1
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+OWNER_RE = re.compile(r"\bowner ([A-Z][a-z]+ [A-Z][a-z]+), ([A-Z][A-Za-z]+)")
+
+
+def _llm_answer(prompt, drop_last=False):
+    profiles = re.split(r"^Profile \d+:$", prompt, flags=re.MULTILINE)
+    answers = []
+    for text in profiles[1:] or profiles:
+        match = OWNER_RE.search(text)
+        answers.append({"owner": match.group(1) if match else "", "title": match.group(2) if match else ""})
+    if len(profiles) > 1:
+        if drop_last:
+            answers = answers[:-1]
+        return json.dumps([{"profile": i, **answer} for i, answer in enumerate(answers, 1)])
+    return json.dumps(answers[0])
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients hang up on kept-alive connections when a run ends
+        pass
+
+
+class FakeServer:
+    """Serve the fixtures on a free localhost port from a background thread."""
+
+    def __init__(self, llm_delay=0.0, llm_batch_drop=False, owners_listed=True):
+        self._httpd = _Server(("127.0.0.1", 0), _Handler)
+        self._httpd.pages = {name: load_fixture(name) for name in os.listdir(FIXTURES) if name.endswith(".html")}
+        self._httpd.requests = 0
+        self._httpd.llm_delay = llm_delay
+        self._httpd.llm_prompts = []
+        self._httpd.llm_batch_drop = llm_batch_drop
+        self._httpd.owners_listed = owners_listed
+        self._httpd.scrapedo_down = False
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def requests(self):
+        return self._httpd.requests
+
+    @property
+    def llm_prompts(self):
+        return self._httpd.llm_prompts
+
+    @property
+    def scrapedo_down(self):
+        return self._httpd.scrapedo_down
+
+    @scrapedo_down.setter
+    def scrapedo_down(self, down):
+        self._httpd.scrapedo_down = down
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class HttpPool:
+    """Stands in for BrowserPool: "browser" page loads become plain GETs."""
+
+    size = 2
+
+    @contextmanager
+    def session(self, timeout=None):
+        yield self
+
+    def get_page_source(self, url, timeout=30):
+        import requests
+
+        return requests.get(url, timeout=timeout).text
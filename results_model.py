@@ -0,0 +1,161 @@
+"""Table model behind the GUI's results view.
+
+Holds the ``PersonRecord`` objects found by every job, each under the name
+of the job (search) that found it, and hands the view only the cells it
+paints, so a few hundred thousand rows stay cheap. Sorting and
+filtering work on a list of row numbers in Python instead of going
+through a ``QSortFilterProxyModel``, which would call ``data()`` once per
+cell for every comparison.
+"""
+from operator import attrgetter
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from bbb_scraper.records import FIELDS, MULTI_FIELDS
+
+# The first column is the job that found the row, not a record field
+JOB = "job"
+COLUMNS = [JOB] + list(FIELDS) + list(MULTI_FIELDS)
+HEADERS = ["Job"] + list(FIELDS.values()) + [f"{label}s" for label in MULTI_FIELDS.values()]
+_single_fields = attrgetter(*FIELDS)
+
+
+def cell_text(record, attr):
+    value = getattr(record, attr)
+    if attr in MULTI_FIELDS:
+        return ", ".join(value)
+    return "" if value is None else str(value)
+
+
+def search_text(record, job=""):
+    """Every cell of ``record`` and its ``job``, lower-cased, in one string the filter can search."""
+    values = [job] + [str(value) for value in _single_fields(record) if value is not None]
+    return "\n".join(values + record.phones + record.emails).lower()
+
+
+def _sort_key(attr):
+    if attr == "age":
+        # Ages sort as numbers, blanks last
+        return lambda record: (0, int(record.age)) if str(record.age or "").isdigit() else (1, 0)
+    return lambda record: cell_text(record, attr).lower()
+
+
+class ResultsModel(QAbstractTableModel):
+    """Rows of ``PersonRecord`` objects, appended in batches, sortable and filterable."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._records = []
+        # Name of the job that found each record
+        self._jobs = []
+        # Row numbers into _records that are shown, in display order
+        self._view = []
+        self._filter = ""
+        self._sort_column = None
+        self._sort_order = Qt.AscendingOrder
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._view)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role in (Qt.DisplayRole, Qt.ToolTipRole) and index.isValid():
+            i = self._view[index.row()]
+            if COLUMNS[index.column()] == JOB:
+                return self._jobs[i]
+            return cell_text(self._records[i], COLUMNS[index.column()])
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return section + 1
+
+    @property
+    def total(self):
+        return len(self._records)
+
+    def record(self, row):
+        return self._records[self._view[row]]
+
+    def job(self, row):
+        return self._jobs[self._view[row]]
+
+    def append_records(self, records, jobs=None):
+        """Add a batch of records, found by the jobs named in ``jobs``, with one insert notification (or one re-sort)."""
+        if not records:
+            return
+        start = len(self._records)
+        self._records.extend(records)
+        self._jobs.extend(jobs if jobs is not None else [""] * len(records))
+        new_rows = [i for i in range(start, len(self._records)) if self._matches(i)]
+        if not new_rows:
+            return
+        if self._sort_column is None:
+            first = len(self._view)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+            self._view.extend(new_rows)
+            self.endInsertRows()
+        else:
+            def merge():
+                # Timsort merges the sorted view and the new tail in about linear time
+                self._view.extend(new_rows)
+                self._sort_view()
+            self._relayout(merge)
+
+    def clear(self):
+        self.beginResetModel()
+        self._records = []
+        self._jobs = []
+        self._view = []
+        self.endResetModel()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort by ``column``; -1 goes back to the order rows arrived in."""
+        self._sort_column = column if column >= 0 else None
+        self._sort_order = order
+        self._relayout(self._view.sort if self._sort_column is None else self._sort_view)
+
+    def set_filter(self, text):
+        """Show only rows with ``text`` (case-insensitive) in any column."""
+        text = text.strip().lower()
+        if text == self._filter:
+            return
+        self.beginResetModel()
+        self._filter = text
+        self._view = [i for i in range(len(self._records)) if self._matches(i)]
+        self._sort_view()
+        self.endResetModel()
+
+    def _relayout(self, change):
+        """Run ``change()`` on the view and keep selections on the same records."""
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        records = [self._view[index.row()] for index in persistent]
+        change()
+        if persistent:
+            rows = {i: row for row, i in enumerate(self._view)}
+            self.changePersistentIndexList(persistent, [self.index(rows[i], index.column())
+                                                        for i, index in zip(records, persistent)])
+        self.layoutChanged.emit()
+
+    def _matches(self, i):
+        if not self._filter:
+            return True
+        return self._filter in search_text(self._records[i], self._jobs[i])
+
+    def _sort_view(self):
+        if self._sort_column is None:
+            return
+        reverse = self._sort_order == Qt.DescendingOrder
+        if COLUMNS[self._sort_column] == JOB:
+            jobs = self._jobs
+            self._view.sort(key=lambda i: jobs[i].lower(), reverse=reverse)
+            return
+        key = _sort_key(COLUMNS[self._sort_column])
+        records = self._records
+        self._view.sort(key=lambda i: key(records[i]), reverse=reverse)
@@ -1,22 +1,33 @@
+import time
+# Startup is timed from here; see startup_report()
+_started = time.perf_counter()
+
 import sys
+import argparse
+import threading
 from PyQt5.QtGui import QPixmap, QPalette, QBrush, QIcon
-from PyQt5.QtWidgets import QApplication, QWidget, QProgressBar
-from PyQt5.QtCore import QThread, pyqtSignal, QTimer
-from PyQt5 import uic
-import requests
-import re
-import pandas as pd
-import json
-import asyncio
-import time
+from PyQt5.QtWidgets import QApplication, QWidget, QProgressBar, QTableWidgetItem
+from PyQt5.QtCore import QTimer, Qt
+import os
+
+from bbb_scraper.cache import PageCache
+from bbb_scraper.fingerprint import FingerprintStore
+from bbb_scraper.jobs import DONE, QUEUED, JobScheduler, OutputInUse, default_output_path
+from bbb_scraper.journal import RunJournal, journal_path
+from bbb_scraper.settings import Settings
+from results_model import ResultsModel
 
-from seleniumbase import SB
-from bs4 import BeautifulSoup
-import os, tempfile
-# Optional: force a known location for drivers
-os.environ["SELENIUMBASE_DRIVER_PATH"] = os.path.join(os.path.expanduser("~"), ".seleniumbase", "drivers")
+# Kept importable from here for existing callers; the engine itself only
+# loads when the first job starts
+_ENGINE_NAMES = {"POSSIBLE_TITLES", "crawl_bbb_business", "fetch_bbb_page", "get_address", "get_business_name",
+                 "get_start_year", "parse_owner_title_from_html"}
 
-os.environ["SELENIUMBASE_DRIVER_DIR"] = os.path.join(tempfile.gettempdir(), "seleniumbase_drivers")
+
+def __getattr__(name):
+    if name in _ENGINE_NAMES:
+        from bbb_scraper import engine
+        return getattr(engine, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 #https://stackoverflow.com/questions/31836104/pyinstaller-and-onefile-how-to-include-an-image-in-the-exe-file
 def resource_path(relative_path):
@@ -29,175 +40,84 @@ def resource_path(relative_path):
 
     return os.path.join(base_path, relative_path)
 
-POSSIBLE_TITLES = ["owner", "president", "ceo", "founder"]
-
-
-def fetch_bbb_page(url):
-    with SB(uc=True, headless=True) as sb:
-        sb.open(url)
-        sb.wait_for_ready_state_complete(30)
-        content = sb.get_page_source()
-        return content
-
 
-def parse_owner_title_from_html(html):
-    soup = BeautifulSoup(html, "html.parser")
-    # Search for label elements containing possible titles
-    owner_info = []
+def load_ui(widget):
+    """Build the widgets of UI/app.ui on ``widget``.
 
-    # Find the section with heading 'Additional Contact Information'
-    sections = soup.find_all("div", class_="bpr-details-section stack")
-
-    for section in sections:
-        heading = section.find("h3", class_="bds-body bpr-details-section-heading")
-        if heading and "Additional Contact Information" in heading.text:
-            # In this section, find all <dt> and corresponding <dd> pairs
-            dl = section.find("dl", class_="bpr-details-dl stack")
-            if not dl:
-                continue
-            for div_data in dl.find_all("div", class_="bpr-details-dl-data"):
-                dt = div_data.find("dt")
-                if not dt:
-                    continue
-                label = dt.text.strip()
-                # We are interested in Principal Contacts or Customer Contacts
-                if label in ["Principal Contacts", "Customer Contacts"]:
-                    # There can be multiple <dd> under this div
-                    dds = div_data.find_all("dd")
-                    for dd in dds:
-                        text = dd.get_text(separator=" ", strip=True)
-                        # text example: "Roderick Mays, Owner"
-                        owner_info.append(text)
-    if owner_info:
-        return {f"owner{idx}": owner for idx, owner in enumerate(owner_info)}
-    return None
-
-
-def get_address(html):
-    soup = BeautifulSoup(html, "html.parser")
-    address = soup.find('div', class_='bpr-overview-address').text
-    return address
-
-
-def get_business_name(html):
-    soup = BeautifulSoup(html, "html.parser")
-    bname = soup.find('span', {"id": 'businessName'}).text
-    return bname
-
-
-def get_start_year(html):
-    start_date = None
-    soup = BeautifulSoup(html, "html.parser")
-    raw_divs = soup.find_all('div', {"class": 'bpr-details-dl-data'})
-    for div in raw_divs:
-        if "Business Started:" in div.text:
-            start_date = div.find('dd').text
-    return start_date
-
-
-async def crawl_bbb_business(url):
-    html = fetch_bbb_page(url)
-    result = parse_owner_title_from_html(html)
-    address = get_address(html)
-    bname = get_business_name(html)
-    start_date = get_start_year(html)
-    return html, result, address, bname, start_date
-
-
-class ScrapingWorker(QThread):
-    """Worker thread for scraping operations"""
-    progress_updated = pyqtSignal(int)
-    status_updated = pyqtSignal(str)
-    result_updated = pyqtSignal(str)
-    business_count_updated = pyqtSignal(int)
-    finished_scraping = pyqtSignal(list)
-
-    def __init__(self, search_keywords, state, scrapedo_key, parent_app):
-        super().__init__()
-        self.search_keywords = search_keywords
-        self.state = state
-        self.scrapedo_key = scrapedo_key
-        self.parent_app = parent_app
-
-    def run(self):
-        persons = []
-
-        try:
-            # Step 1: Get business URLs
-            self.status_updated.emit("Getting business URLs...")
-            self.progress_updated.emit(10)
-
-            business_urls = self.parent_app.get_urls(
-                search_keywords=self.search_keywords,
-                state=self.state
-            )
-
-            self.status_updated.emit(f"Found {len(business_urls)} business URLs")
-            self.business_count_updated.emit(len(business_urls))
-            self.progress_updated.emit(20)
-
-            if not business_urls:
-                self.status_updated.emit("No business URLs found")
-                self.finished_scraping.emit([])
-                return
-
-            # Step 2: Process each business (limit to first 3 for demo)
-            urls_to_process = business_urls[:3]
-            total_urls = len(urls_to_process)
-
-            for i, url in enumerate(urls_to_process):
-                try:
-                    self.status_updated.emit(f"Processing business {i + 1}/{total_urls}...")
-
-                    people = asyncio.run(self.parent_app.run_demo(url, self.scrapedo_key))
-
-                    if people:
-                        self.status_updated.emit(f"Found {len(people)} people from business {i + 1}")
-                        for p in people:
-                            self.result_updated.emit(str(p))
-                        persons.extend(people)
-                    else:
-                        self.status_updated.emit(f"No people found for business {i + 1}")
-
-                    # Update progress (20% for URL collection, 80% for processing)
-                    progress = 20 + int((i + 1) / total_urls * 80)
-                    self.progress_updated.emit(progress)
-
-                except Exception as e:
-                    self.status_updated.emit(f"Error processing business {i + 1}: {str(e)}")
-                    continue
-
-            # Step 3: Save results
-            if persons:
-                self.status_updated.emit("Saving results to CSV...")
-                pd.DataFrame(persons).drop_duplicates().to_csv('people.csv', index=False)
-                self.status_updated.emit(f"Completed! Saved {len(persons)} records to people.csv")
-            else:
-                self.status_updated.emit("No data to save")
-
-            self.progress_updated.emit(100)
-            self.finished_scraping.emit(persons)
-
-        except Exception as e:
-            self.status_updated.emit(f"Error: {str(e)}")
-            self.finished_scraping.emit([])
+    Uses UI/app_ui.py, compiled ahead of time with
+    ``pyuic5 UI/app.ui -o UI/app_ui.py``, and only parses the .ui file at
+    runtime (with ``uic.loadUi``) when that module is missing or older than
+    the .ui file in a source checkout.
+    """
+    ui_file = resource_path('UI\\app.ui')
+    try:
+        from UI import app_ui
+    except ImportError:
+        app_ui = None
+    stale = (app_ui is not None and not getattr(sys, 'frozen', False) and os.path.exists(ui_file)
+             and os.path.getmtime(ui_file) > os.path.getmtime(app_ui.__file__))
+    if app_ui is None or stale:
+        from PyQt5 import uic
+        uic.loadUi(ui_file, widget)
+        return
+    ui = app_ui.Ui_MainWindow()
+    ui.setupUi(widget)
+    # Same attributes loadUi would have set: self.pushButton_run, ...
+    vars(widget).update(vars(ui))
+
+
+def startup_report(marks):
+    """``[("imports", t), ...]`` (perf_counter times) -> ``"Startup 0.21s: imports 0.14s, ..."``."""
+    phases = []
+    previous = _started
+    for name, at in marks:
+        phases.append(f"{name} {at - previous:.2f}s")
+        previous = at
+    return f"Startup {previous - _started:.2f}s: " + ", ".join(phases)
+
+
+JOB_COLUMNS = ["Search", "Location", "State", "Progress", "ETA", "Saved", "Output"]
+
+
+def format_eta(seconds):
+    """``3725`` -> ``"1:02:05"``; unknown -> ``"-"``."""
+    if seconds is None:
+        return "-"
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
 
 
 class AppDemo(QWidget):
     def __init__(self):
         super().__init__()
-        uic.loadUi(resource_path('UI\\app.ui'), self)
+        load_ui(self)
 
         self.setWindowIcon(QIcon(resource_path("icon.ico")))
 
         # Existing UI elements
         self.line1 = self.lineEdit_search_keywords
         self.line3 = self.lineEdit_state
-        self.text_area = self.textEdit_results
-        self.text_area.setStyleSheet("""
+        # Results live in a model; the view only asks for the rows it shows
+        self.results_model = ResultsModel(self)
+        self.results_view = self.tableView_results
+        self.results_view.setModel(self.results_model)
+        self.results_view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.results_view.horizontalHeader().setStretchLastSection(True)
+        self.results_view.verticalHeader().setDefaultSectionSize(22)
+        self.results_view.setStyleSheet("""
             background-color: rgba(0, 0, 0, 200);
-            color: grey;   /* Set text color to contrast with background */
-            border: 1px solid white; /* optional */
+            color: green;
+            border: 1px solid white;
+        """)
+        self.filter_line = self.lineEdit_filter
+        self.filter_line.textChanged.connect(lambda: self.filter_timer.start())
+        self.stats_text = self.plainTextEdit_stats
+        self.stats_text.setStyleSheet("""
+            background-color: rgba(0, 0, 0, 200);
+            color: grey;
+            border: 1px solid white;
+            font-family: monospace;
         """)
         self.business_count_text = self.textEdit_count
         self.business_count_text.setStyleSheet("""
@@ -242,276 +162,290 @@ class AppDemo(QWidget):
 
         self.SCRAPEDO_API_KEY = "token"
 
-        # Worker thread
-        self.worker = None
+        # See bbb_scraper.engine.Settings for every knob; the demo stops after
+        # the first 3 businesses (max_businesses=None processes them all)
+        self.settings = Settings(max_businesses=3)
+
+        # Each job writes <keywords>_<location>.csv (and its journal) here
+        self.OUTPUT_DIR = '.'
+
+        # Queued searches run MAX_JOBS at a time and share BROWSERS Chrome
+        # sessions. Pages fetched in earlier runs are reused until their TTL
+        # runs out; pass page_cache=None to always fetch live pages. Jobs
+        # queued with "Refresh" keep their profile fingerprints in
+        # self.fingerprints and only re-scrape profiles that changed.
+        self.MAX_JOBS = 2
+        self.BROWSERS = 4
+        self.fingerprints = FingerprintStore()
+        self.scheduler = JobScheduler(self.SCRAPEDO_API_KEY, self.settings, max_jobs=self.MAX_JOBS,
+                                      browsers=self.BROWSERS,
+                                      page_cache=PageCache(max_bytes=500 * 1024 * 1024),
+                                      fingerprints=self.fingerprints,
+                                      on_status=self.update_status, on_row=self.buffer_result)
+        self.reported_jobs = set()
+        # Set once the window was asked to close while jobs were running
+        self.closing = False
+
+        # (job name, row) pairs found by the job threads wait here for the results timer
+        self.pending_results = []
+        self.pending_lock = threading.Lock()
+
+        self.jobs_table = self.tableWidget_jobs
+        self.jobs_table.setColumnCount(len(JOB_COLUMNS))
+        self.jobs_table.setHorizontalHeaderLabels(JOB_COLUMNS)
+        self.jobs_table.horizontalHeader().setStretchLastSection(True)
+        self.jobs_table.verticalHeader().setVisible(False)
+        self.jobs_table.setStyleSheet("""
+            background-color: rgba(0, 0, 0, 200);
+            color: grey;
+            border: 1px solid white;
+        """)
+        self.jobs_table.itemSelectionChanged.connect(self.refresh_jobs)
+        self.pushButton_pause.clicked.connect(self.toggle_pause)
+        self.pushButton_cancel.clicked.connect(self.cancel_jobs)
+
+        # Job progress, ETAs and the selected job's stage timings
+        self.jobs_timer = QTimer(self)
+        self.jobs_timer.setInterval(500)
+        self.jobs_timer.timeout.connect(self.refresh_jobs)
+        self.jobs_timer.start()
+
+        # Rows found by the jobs are added to the table in batches
+        self.results_timer = QTimer(self)
+        self.results_timer.setInterval(250)
+        self.results_timer.timeout.connect(self.flush_results)
+        self.results_timer.start()
+
+        # Filter once typing pauses, not on every keystroke
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(300)
+        self.filter_timer.timeout.connect(self.apply_filter)
 
     def printValue(self):
         print(self.lineEdit_country.text())
 
+    def output_path(self, search_keywords, state):
+        return default_output_path(search_keywords, state, self.OUTPUT_DIR)
+
+    def can_resume(self):
+        path = journal_path(self.output_path(self.line1.text().strip(), self.line3.text().strip()))
+        # A finished run's journal stays behind but has nothing left to resume
+        return RunJournal.exists(path) and not RunJournal.load(path).finished
+
     def check_input(self):
         text1, text2 = self.line1.text().strip(), self.line3.text().strip()
-        if text1 and text2:
-            self.pushButton_run.setDisabled(False)
-        else:
-            self.pushButton_run.setDisabled(True)
+        self.pushButton_run.setDisabled(self.closing or not (text1 and text2))
 
     def run_all(self):
+        """Queue the search in the inputs; it starts as soon as a job slot is free"""
         search_keywords = self.line1.text().strip()
         state = self.line3.text().strip()
 
         if not all([search_keywords, state]):
             return
 
-        # Disable the run button and show progress bar
-        self.pushButton_run.setDisabled(True)
-        self.pushButton_run.setText("Running...")
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-
-        # Clear previous results
-        self.text_area.clear()
-        self.business_count_text.clear()
-
-        # Create and start worker thread
-        self.worker = ScrapingWorker(search_keywords, state, self.SCRAPEDO_API_KEY, self)
-        self.worker.progress_updated.connect(self.update_progress)
-        self.worker.status_updated.connect(self.update_status)
-        self.worker.result_updated.connect(self.add_result)
-        self.worker.business_count_updated.connect(self.update_business_count)
-        self.worker.finished_scraping.connect(self.on_scraping_finished)
-
-        self.worker.start()
-
-    def update_progress(self, value):
-        """Update progress bar value"""
-        self.progress_bar.setValue(value)
-
-    def update_status(self, message):
-        """Update status (you can display this in a label or the text area)"""
-        print(f"Status: {message}")
-        # You could also show this in the UI if you have a status label
-        # self.status_label.setText(message) if you have one
-
-    def add_result(self, result):
-        """Add result to text area"""
-        self.text_area.append(f'<span style="color: green;">{result}</span>')
-
-    def update_business_count(self, count):
-        """Update business count display"""
-        self.business_count_text.append(f'<span style="color: green;">Found {count} businesses</span>')
-
-    def on_scraping_finished(self, persons):
-        """Called when scraping is complete"""
-        # Re-enable the run button and hide progress bar
-        self.pushButton_run.setDisabled(False)
-        self.pushButton_run.setText("Run")
-
-        # Hide progress bar after a short delay to show 100% completion
-        QTimer.singleShot(1000, lambda: self.progress_bar.setVisible(False))
-
-        # Show completion message
-        completion_message = f"Scraping completed! Found {len(persons)} total records."
-        print(completion_message)
-        self.text_area.append(f'<span style="color: blue; font-weight: bold;">{completion_message}</span>')
-
-    def clean_text(self, text_to_clean):
-        # Remove honorifics & extra whitespace
-        text = re.sub(r"\b(Mr|Ms|Mrs|Dr|Prof)\.?\s+", "", text_to_clean, flags=re.IGNORECASE)
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
-
-    def extract_emails(self, soup):
-        # Get all text from the page
-        text = soup.get_text(separator=" ")
-
-        # Email regex
-        email_pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-
-        # Find all unique matches
-        emails = set(re.findall(email_pattern, text))
-        return list(emails)
-
-    def get_business_urls(self, html):
-        soup = BeautifulSoup(html, 'html.parser')
-        raw_urls = soup.find_all('a', class_='text-blue-medium')
-        if raw_urls:
-            urls = ["https://www.bbb.org" + url.get('href') for url in raw_urls]
-            return urls
-        return []
-
-    def get_urls(self, search_keywords: str, state: str = "Las Vegas"):
-        urls = []
-        with SB(uc=True, headless=False) as sb:
-            keywords = '+'.join(search_keywords.split())
-            state_keyword = '%20'.join(state.split())
-            sb.open(
-                f"https://www.bbb.org/search?find_country=USA&find_latlng=36.142467%2C-115.204160&find_loc={state_keyword}&find_text={keywords}&page=1&touched=1")
-            sb.wait_for_ready_state_complete(30)
-            raw_pag = sb.get_text("//h1[@class='search-results-heading font-normal text-black']")
-            pagination = int(raw_pag.split()[1]) // 15 + 2
-            urls.extend(self.get_business_urls(sb.get_page_source()))
-            for pag in range(2, pagination):
-                sb.open(
-                    f"https://www.bbb.org/search?find_country=USA&find_latlng=36.142467%2C-115.204160&find_loc={state_keyword}&find_text={keywords}&page={pag}&touched=1")
-                sb.wait_for_ready_state_complete(30)
-                urls.extend(self.get_business_urls(sb.get_page_source()))
-            time.sleep(1)
-        return urls
-
-    def get_people_urls(self, fullname: str, zipcode: str, token: str):
-        fullname = '-'.join(fullname.split()).lower()
-
-        # Scrape.do API endpoint - enabling "super=true" and "geoCode=us" for US-based residential proxies
-        api_url = f"http://api.scrape.do?url=https%3A%2F%2Fwww.truepeoplesearch.com%2Fresults%3Fname%3D{fullname}%26citystatezip%3D{zipcode}&token={token}&super=true&geoCode=us"
-        # Send the request and parse HTML
-        response = requests.get(api_url)
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        raw_urls = soup.find_all('a', {"aria-label": "View All Details"})
-        urls = list(set(["https://www.truepeoplesearch.com" + url.get('href') for url in raw_urls]))
-
-        return urls
-
-    def get_person_details(self, person_id: str, token: str, bname: str, start_date, position: str):
+        resume = self.checkBox_resume.isChecked() and self.can_resume()
         try:
-            url_to_get = f"http://api.scrape.do?url=https://www.truepeoplesearch.com/find/person/{person_id}&token={token}&super=true&geoCode=us"
-            response = requests.get(url_to_get)
-            soup = BeautifulSoup(response.text, "html.parser")
-            person = soup.find("div", id="personDetails")
-            # name = f"{person['data-fn']} {person['data-ln']}"
-            name = soup.find('h1', class_='oh1').text
-            age = person["data-age"]
-            addr = soup.find("a", {"data-link-to-more": "address"})
-            address = addr.find("span", {"itemprop": "streetAddress"}).text.strip()
-            city = addr.find("span", {"itemprop": "addressLocality"}).text.strip()
-            state = addr.find("span", {"itemprop": "addressRegion"}).text.strip()
-
-            # Extract phone number
-            phone = soup.find("a", {"data-link-to-more": "phone"}).find_all("span", itemprop="telephone")
-            phones = [phon.text.strip() for phon in phone]
-            phones_dict = {f'Phone {i}': p for i, p in enumerate(phones)}
-            emails = self.extract_emails(soup)
-            if "support@truepeoplesearch.com" in emails:
-                emails.remove("support@truepeoplesearch.com")
-            emails_dict = {f'Email {i}': p for i, p in enumerate(emails)}
-
-            new_row = {
-                'Name': name,
-                'Age': age,
-                'Position': position,
-                'Address': address,
-                'City': city,
-                'State': state,
-                'Business Name': bname,
-                'Business Start Date': start_date
-            }
-            new_row.update(phones_dict)
-            new_row.update(emails_dict)
-        except:
-            return {}
-
-        return new_row
-
-    def get_owner_by_llm(self, profile_text):
-        prompt = f"""
-        Extract the business owner's name and title from the following text.
-        Remove any honorifics (Mr, Ms, Mrs, Dr, etc.).
-        Respond ONLY in this strict JSON format:
-        {{
-          "owner": "string",
-          "title": "string"
-        }}
-
-        Profile:
-        {profile_text}
-        """
-
-        payload = {
-            "model": "mistral",
-            "messages": [{"role": "user", "content": prompt}]
-        }
-
-        response = requests.post("http://localhost:11434/api/chat", json=payload, stream=True)
-
-        if response.status_code != 200:
-            return {"owner0": "", "title": ""}
-
-        collected_content = ""
+            self.scheduler.submit(search_keywords, state, self.output_path(search_keywords, state), resume,
+                                  refresh=self.checkBox_refresh.isChecked())
+        except OutputInUse as e:
+            self.business_count_text.append(f'<span style="color: orange;">Not queued: {e}</span>')
+            return
+        self.line1.clear()
+        self.line3.clear()
+        self.progress_bar.setVisible(True)
+        self.refresh_jobs()
 
-        for line in response.iter_lines(decode_unicode=True):
-            if not line:
+    def resume_interrupted(self):
+        """Queue every search in OUTPUT_DIR whose journal says it did not finish"""
+        queued = 0
+        for name in sorted(os.listdir(self.OUTPUT_DIR)):
+            if not name.endswith('.journal'):
+                continue
+            journal = RunJournal.load(os.path.join(self.OUTPUT_DIR, name))
+            params = journal.params
+            if journal.finished or not params.get("search_keywords"):
                 continue
             try:
-                json_data = json.loads(line)
-            except json.JSONDecodeError:
+                self.scheduler.submit(params["search_keywords"], params.get("state", ""),
+                                      params.get("output_path"), resume=True)
+            except OutputInUse:
+                # Already queued or running
                 continue
-
-            if "message" in json_data and "content" in json_data["message"]:
-                collected_content += json_data["message"]["content"]
-
-            if json_data.get("done", False):
-                break
-
-        # Extract only the JSON object from the collected content
-        match = re.search(r"\{\s*\"owner\".*\}", collected_content, re.DOTALL)
-        if not match:
-            return {"owner0": "", "title": ""}
-
-        try:
-            result = json.loads(match.group(0))
-        except json.JSONDecodeError:
-            return {"owner0": "", "title": ""}
-
-        # Enforce strict format (in case model omits a field)
-        return {
-            "owner0": result.get("owner", ""),
-            "title": result.get("title", "")
-        }
-
-    async def run_demo(self, bbb_url, scrapedo_key):
+            queued += 1
+        if queued:
+            self.progress_bar.setVisible(True)
+        return queued
+
+    def selected_jobs(self):
+        rows = {index.row() for index in self.jobs_table.selectionModel().selectedRows()}
+        return [self.scheduler.jobs[row] for row in sorted(rows) if row < len(self.scheduler.jobs)]
+
+    def toggle_pause(self):
+        for job in self.selected_jobs():
+            if job.paused:
+                job.resume()
+            else:
+                job.pause()
+        self.refresh_jobs()
+
+    def cancel_jobs(self):
+        for job in self.selected_jobs():
+            job.cancel()
+        self.refresh_jobs()
+
+    def refresh_jobs(self):
+        """Redraw the job table, the overall progress bar and the run stats"""
+        jobs = self.scheduler.jobs
+        table = self.jobs_table
+        if table.rowCount() != len(jobs):
+            for row in range(table.rowCount(), len(jobs)):
+                table.insertRow(row)
+                table.setCellWidget(row, JOB_COLUMNS.index("Progress"), QProgressBar())
+        for row, job in enumerate(jobs):
+            state = "paused (queued)" if job.state == QUEUED and job.paused else job.state
+            eta = "" if job.finished else format_eta(job.eta())
+            cells = [job.keywords, job.location, state, None, eta, str(job.saved), job.output_path]
+            for column, text in enumerate(cells):
+                if text is None:
+                    continue
+                item = table.item(row, column)
+                if item is None:
+                    table.setItem(row, column, QTableWidgetItem(text))
+                elif item.text() != text:
+                    item.setText(text)
+            table.cellWidget(row, JOB_COLUMNS.index("Progress")).setValue(int(job.progress * 100))
+            if job.finished and job.id not in self.reported_jobs:
+                self.reported_jobs.add(job.id)
+                self.on_job_finished(job)
+
+        selected = self.selected_jobs()
+        self.pushButton_pause.setDisabled(not any(not job.finished for job in selected))
+        self.pushButton_cancel.setDisabled(not any(not job.finished for job in selected))
+
+        active = self.scheduler.active
+        if active:
+            processed = sum(job.processed for job in active)
+            discovered = sum(job.discovered for job in active)
+            self.progress_bar.setValue(int(processed / discovered * 100) if discovered else 0)
+        self.update_stats(selected[0] if selected else (active[0] if active else None))
+
+    def update_status(self, job, message):
+        """Called from a job thread with each status message"""
+        print(f"Status [{job.name}]: {message}")
+
+    def update_stats(self, job=None):
+        """Show a job's stage timings and counters"""
+        if job is None:
+            return
+        if job.scraper is None:
+            self.stats_text.setPlainText(f"{job.name}: {job.state}")
+        else:
+            self.stats_text.setPlainText(f"{job.name}\n{job.metrics.summary()}")
+
+    def buffer_result(self, job, record):
+        """Called from a job thread for every new row"""
+        with self.pending_lock:
+            self.pending_results.append((job.name, record))
+
+    def flush_results(self):
+        """Move the rows the jobs have found into the results table"""
+        with self.pending_lock:
+            found, self.pending_results = self.pending_results, []
+        if found:
+            jobs, records = zip(*found)
+            self.results_model.append_records(list(records), list(jobs))
+
+    def apply_filter(self):
+        self.results_model.set_filter(self.filter_line.text())
+
+    def on_job_finished(self, job):
+        """Called once per job when it is done, failed or cancelled"""
+        self.flush_results()
+        if job.state == DONE:
+            message = (f"{job.name}: found {job.discovered} businesses, "
+                       f"saved {job.saved} records to {job.output_path}")
+            color = "green"
+        else:
+            message = f"{job.name}: {job.state}" + (f" ({job.error})" if job.error else "")
+            color = "orange"
+        print(message)
+        self.business_count_text.append(f'<span style="color: {color};">{message}</span>')
+
+        if self.closing and not self.scheduler.active:
+            QTimer.singleShot(0, self.close)
+        elif not self.scheduler.active:
+            # Hide progress bar after a short delay to show 100% completion
+            self.progress_bar.setValue(100)
+            QTimer.singleShot(1000, lambda: self.progress_bar.setVisible(bool(self.scheduler.active)))
+
+    def startup_finished(self, report, warm_up=True):
+        """Called once the window is up: show how long startup took, then warm up the browser"""
+        print(report)
+        if not self.stats_text.toPlainText():
+            self.stats_text.setPlainText(report)
+        if warm_up:
+            threading.Thread(target=self.warm_up_browser, name="browser-warmup", daemon=True).start()
+
+    def warm_up_browser(self):
+        """Install and check the browser driver now, unless an earlier launch already did"""
         try:
-            # Step 1: Crawl BBB business page
-            html, owner_title, address, bname, start_date = await crawl_bbb_business(bbb_url)
-            zip_code = address.split()[-1].split('-')[0]
-            if not owner_title:
-                soup = BeautifulSoup(html, 'html.parser')
-                page_text_content = soup.get_text(separator='\n', strip=True)
-                owner_title = self.get_owner_by_llm(page_text_content)
-
-            people_urls = {}
-            if owner_title:
-                for i in range(len(owner_title.keys())):
-                    try:
-                        full_owner_info = owner_title.get(f'owner{i}', "")
-                        owner = self.clean_text(full_owner_info.split(',')[0])
-                        if full_owner_info not in people_urls:
-                            people_urls[full_owner_info] = self.get_people_urls(owner, zip_code, scrapedo_key)
-                    except:
-                        continue
-
-            persons = []
-
-            for person, urls in people_urls.items():
-                for url in urls:
-                    try:
-                        pid = url.split('/')[-1]
-                        position = person.split(',')[-1].strip() if len(person.split(',')) >= 2 else None
-                        result = self.get_person_details(pid, scrapedo_key, bname, start_date, position)
-                        if result:
-                            persons.append(result)
-                    except:
-                        continue
-            return persons
+            from bbb_scraper.browser import warm_up_driver
+            if warm_up_driver():
+                print("Browser driver installed and checked")
         except Exception as e:
-            print(e)
-            print("no available information")
-            return []
+            print(f"Browser warm-up failed: {e}")
+
+    def closeEvent(self, event):
+        # Running jobs stop after the businesses in flight; their journals
+        # let --resume pick them up next time. That can take a request
+        # timeout or two, so wait for it with the window still responsive;
+        # on_job_finished closes it once the last job is done
+        active = self.scheduler.active
+        if active:
+            event.ignore()
+            if not self.closing:
+                self.closing = True
+                for job in active:
+                    job.cancel()
+                self.pushButton_run.setDisabled(True)
+                self.business_count_text.append(
+                    f'<span style="color: orange;">Closing once {len(active)} job(s) stop...</span>')
+            return
+        self.scheduler.shutdown()
+        self.fingerprints.close()
+        super().closeEvent(event)
 
 
 if __name__ == '__main__':
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="BBB.org Business Scraper")
+    parser.add_argument("--resume", action="store_true", help="queue every interrupted run again")
+    parser.add_argument("--trace", action="store_true",
+                        help="write per-stage timings to <output>.trace.jsonl for each job")
+    parser.add_argument("--profile", choices=["cprofile", "pyinstrument"],
+                        help="profile each run; the report is saved next to the output CSV")
+    parser.add_argument("--no-warm-up", action="store_true",
+                        help="do not start a browser in the background to install and check its driver")
+    args, qt_args = parser.parse_known_args()
+
+    marks = [("imports", time.perf_counter())]
+    app = QApplication(sys.argv[:1] + qt_args)
+    marks.append(("QApplication", time.perf_counter()))
     demo = AppDemo()
+    marks.append(("window", time.perf_counter()))
+    demo.scheduler.trace = args.trace
+    demo.settings.profiler = args.profile
     demo.show()
+    if args.resume and not demo.resume_interrupted():
+        print("No interrupted run to resume")
+
+    def shown():
+        marks.append(("shown", time.perf_counter()))
+        demo.startup_finished(startup_report(marks), warm_up=not args.no_warm_up)
+
+    # Fires once the event loop is running and the window has been drawn
+    QTimer.singleShot(0, shown)
 
     try:
         sys.exit(app.exec_())
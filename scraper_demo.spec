@@ -0,0 +1,42 @@
+# PyInstaller build of the GUI:  pyinstaller scraper_demo.spec
+#
+# Builds a one-folder app (dist/BBB-Scraper/BBB-Scraper.exe). A --onefile
+# exe unpacks every bundled library to a temporary folder on each launch,
+# which costs seconds before the window can open; the folder build starts
+# as fast as running from source. resource_path() works in both layouts.
+import os
+
+from PyInstaller.utils.hooks import collect_data_files
+
+datas = collect_data_files("seleniumbase")
+# Optional artwork; the app runs without it
+for path, target in [("assets/background.png", "assets"), ("icon.ico", ".")]:
+    if os.path.exists(path):
+        datas.append((path, target))
+
+a = Analysis(
+    ["scraper_demo.py"],
+    pathex=["."],
+    datas=datas,
+    # The UI is compiled to UI/app_ui.py (pyuic5 UI/app.ui -o UI/app_ui.py)
+    # and the engine is imported lazily; list both so they are bundled
+    hiddenimports=["UI.app_ui", "bbb_scraper.engine"],
+    # uic only parses app.ui when UI/app_ui.py is missing; the rest are
+    # never used by the app
+    excludes=["PyQt5.uic", "tkinter", "matplotlib", "IPython", "pytest"],
+    noarchive=False,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name="BBB-Scraper",
+    icon="icon.ico" if os.path.exists("icon.ico") else None,
+    console=False,
+    # UPX-packed DLLs have to be unpacked at load time
+    upx=False,
+)
+coll = COLLECT(exe, a.binaries, a.datas, name="BBB-Scraper", upx=False)
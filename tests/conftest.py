@@ -0,0 +1,52 @@
+import asyncio
+import csv
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# The end-to-end tests run against the benchmarks' local fake of bbb.org,
+# scrape.do and the LLM
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from fakeserver import FakeServer, HttpPool  # noqa: E402
+
+from bbb_scraper.engine import Scraper, Settings  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    with FakeServer() as server:
+        yield server
+
+
+@pytest.fixture
+def make_scraper():
+    """``make_scraper(server, settings=None, **kwargs)``: a ``Scraper`` pointed at a ``FakeServer``."""
+    def make(server, settings=None, **kwargs):
+        scraper = Scraper("key", settings or Settings(), **kwargs)
+        scraper.bbb_base_url = server.url
+        scraper.scrapedo_api_url = server.url + "/scrapedo"
+        scraper.llm_chat_url = server.url + "/api/chat"
+        return scraper
+    return make
+
+
+@pytest.fixture
+def run_search():
+    """``run_search(scraper, output_path, **kwargs)``: one ``run_async`` of the fixture search."""
+    def run(scraper, output_path, **kwargs):
+        with ThreadPoolExecutor(2) as executor:
+            return asyncio.run(scraper.run_async("plumber", "Las Vegas", HttpPool(), executor, str(output_path),
+                                                 **kwargs))
+    return run
+
+
+@pytest.fixture
+def read_rows():
+    """``read_rows(path)``: the data rows of a CSV, header left out."""
+    def read(path):
+        with open(path, newline="", encoding="utf-8") as f:
+            return list(csv.reader(f))[1:]
+    return read
@@ -0,0 +1,54 @@
+import os
+import time
+
+from bbb_scraper.cache import PageCache
+
+
+def page():
+    # Random hex barely compresses, so every page takes about 1 KB
+    return os.urandom(1000).hex()
+
+
+def test_pages_expire_after_their_source_ttl(tmp_path, monkeypatch):
+    cache = PageCache(str(tmp_path / "pages.sqlite3"), ttls={"bbb_search": 60})
+    cache.put("https://x/search", "search", "bbb_search")
+    cache.put("https://x/person", "person", "person")
+
+    later = time.time() + 120
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert cache.get("https://x/search", "bbb_search") is None
+    assert cache.get("https://x/person", "person") == "person"
+
+
+def test_least_recently_used_pages_are_evicted_first(tmp_path):
+    cache = PageCache(str(tmp_path / "pages.sqlite3"), max_bytes=10_000)
+    for n in range(8):
+        cache.put(f"https://x/{n}", page(), "person")
+        time.sleep(0.001)
+    # Reading page 0 makes page 1 the oldest
+    assert cache.get("https://x/0", "person") is not None
+    for n in range(8, 12):
+        cache.put(f"https://x/{n}", page(), "person")
+
+    assert cache.get("https://x/0", "person") is not None
+    assert cache.get("https://x/1", "person") is None
+    assert cache.stats()["size_bytes"] <= 10_000
+
+
+def test_size_limit_counts_pages_of_every_process(tmp_path):
+    path = str(tmp_path / "pages.sqlite3")
+    first, second = PageCache(path, max_bytes=20_000), PageCache(path, max_bytes=20_000)
+    for n in range(40):
+        (first if n % 2 else second).put(f"https://x/{n}", page(), "person")
+
+    total = first._db.execute("SELECT SUM(size) FROM pages").fetchone()[0]
+    assert total <= 20_000
+    assert PageCache(path).stats()["size_bytes"] == total
+
+
+def test_rejected_pages_are_returned_but_not_stored(tmp_path):
+    cache = PageCache(str(tmp_path / "pages.sqlite3"))
+    body = cache.get_or_fetch("https://x/a", "person", lambda: "captcha", is_valid=lambda html: "ok" in html)
+
+    assert body == "captcha"
+    assert cache.get("https://x/a", "person") is None
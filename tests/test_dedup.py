@@ -0,0 +1,90 @@
+import time
+
+import pytest
+
+from bbb_scraper.dedup import SeenIndex
+
+URL = "https://www.bbb.org/us/nv/las-vegas/profile/plumber/desert-valley-1086-90001"
+
+
+@pytest.fixture
+def index(tmp_path):
+    with SeenIndex(str(tmp_path / "seen.sqlite3")) as index:
+        yield index
+
+
+def later(monkeypatch, seconds):
+    now = time.time() + seconds
+    monkeypatch.setattr(time, "time", lambda: now)
+
+
+def in_progress(index):
+    return index._db.execute("SELECT COUNT(*) FROM businesses WHERE done = 0").fetchone()[0]
+
+
+def test_business_is_claimed_once_across_url_variants(index):
+    assert index.claim_businesses([URL]) == [URL]
+    assert index.claim_businesses([URL + "/addressId/4?tab=1", URL.upper()]) == []
+
+
+def test_released_business_can_be_claimed_again(index):
+    index.claim_businesses([URL])
+    index.release_business(URL)
+    assert index.claim_businesses([URL]) == [URL]
+
+
+def test_completed_business_is_not_released(index):
+    index.claim_businesses([URL])
+    index.complete_business(URL)
+    index.release_business(URL)
+    assert index.claim_businesses([URL]) == []
+
+
+def test_unfinished_claim_expires_after_the_lease(index, monkeypatch):
+    index.claim_businesses([URL])
+    later(monkeypatch, index.lease - 60)
+    assert index.claim_businesses([URL]) == []
+    later(monkeypatch, index.lease + 60)
+    assert index.claim_businesses([URL]) == [URL]
+
+
+def test_completed_claim_expires_only_with_max_age(tmp_path, monkeypatch):
+    path = str(tmp_path / "seen.sqlite3")
+    with SeenIndex(path) as index:
+        index.claim_businesses([URL])
+        index.complete_business(URL)
+    later(monkeypatch, 10 * 24 * 3600)
+    with SeenIndex(path) as index:
+        assert index.claim_businesses([URL]) == []
+    with SeenIndex(path, max_age=7 * 24 * 3600) as index:
+        assert index.claim_businesses([URL]) == [URL]
+
+
+def test_contacts_are_matched_on_normalized_name_and_zip(index):
+    assert index.claim_contact("Roderick Mays", "89102")
+    assert not index.claim_contact("roderick  MAYS.", "89102")
+    assert index.claim_contact("Roderick Mays", "89103")
+    index.release_contact("Roderick Mays", "89102")
+    assert index.claim_contact("Roderick Mays", "89102")
+
+
+def test_cancelled_run_hands_back_its_unfinished_claims(server, tmp_path, make_scraper, run_search, index):
+    calls = 0
+
+    async def cancel():
+        nonlocal calls
+        calls += 1
+        if calls > 6:
+            raise RuntimeError("cancelled")
+
+    with pytest.raises(RuntimeError):
+        run_search(make_scraper(server, seen_index=index), tmp_path / "cancelled.csv", checkpoint=cancel)
+    assert in_progress(index) == 0
+    assert index._db.execute("SELECT COUNT(*) FROM contacts WHERE done = 0").fetchone()[0] == 0
+    finished = index.stats()["businesses"]
+
+    # The next run takes every business the cancelled one did not finish
+    result = run_search(make_scraper(server, seen_index=index), tmp_path / "people.csv")
+    assert result.discovered == 15 - finished
+    assert index.stats()["businesses"] == 15
+    assert in_progress(index) == 0
@@ -0,0 +1,38 @@
+from bbb_scraper.engine import Settings
+from bbb_scraper.fingerprint import FingerprintStore
+
+
+def test_refresh_of_unchanged_search_reuses_every_row(server, tmp_path, make_scraper, run_search, read_rows):
+    store = FingerprintStore(str(tmp_path / "fingerprints.sqlite3"))
+    first = run_search(make_scraper(server, fingerprints=store), tmp_path / "first.csv")
+    prompts = len(server.llm_prompts)
+
+    scraper = make_scraper(server, fingerprints=store)
+    second = run_search(scraper, tmp_path / "second.csv")
+
+    assert second.discovered == first.discovered
+    assert scraper.metrics.counters["refresh.unchanged"] == second.discovered
+    assert scraper.metrics.counters["refresh.changed"] == 0
+    assert len(server.llm_prompts) == prompts
+    assert sorted(read_rows(tmp_path / "second.csv")) == sorted(read_rows(tmp_path / "first.csv"))
+    # Header only: nothing new, changed or removed
+    assert read_rows(tmp_path / "second.csv.diff.csv") == []
+
+
+def test_refresh_retries_businesses_whose_lookups_failed(server, tmp_path, make_scraper, run_search, read_rows):
+    store = FingerprintStore(str(tmp_path / "fingerprints.sqlite3"))
+    settings = Settings(http_retries=0)
+    expected = run_search(make_scraper(server, settings), tmp_path / "plain.csv")
+
+    server.scrapedo_down = True
+    scraper = make_scraper(server, settings, fingerprints=store)
+    assert run_search(scraper, tmp_path / "down.csv").saved == 0
+    assert scraper.metrics.counters["business.incomplete"] > 0
+
+    server.scrapedo_down = False
+    scraper = make_scraper(server, settings, fingerprints=store)
+    result = run_search(scraper, tmp_path / "up.csv")
+
+    assert result.saved == expected.saved
+    assert scraper.metrics.counters["refresh.unchanged"] == 0
+    assert sorted(read_rows(tmp_path / "up.csv")) == sorted(read_rows(tmp_path / "plain.csv"))
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from bbb_scraper.journal import RunJournal
+
+
+
+def test_resume_after_crash_writes_no_duplicate_rows(server, tmp_path, make_scraper, run_search, read_rows):
+    run_search(make_scraper(server), tmp_path / "clean.csv")
+    expected = sorted(read_rows(tmp_path / "clean.csv"))
+
+    written = []
+
+    async def crash():
+        # Dies before the next business once some rows are on disk
+        if written:
+            raise RuntimeError("crashed")
+
+    output = tmp_path / "people.csv"
+    with pytest.raises(RuntimeError):
+        run_search(make_scraper(server), output, on_row=written.append, checkpoint=crash)
+    assert read_rows(output)
+    run_search(make_scraper(server), output, resume=True)
+
+    rows = read_rows(output)
+    assert len(rows) == len(set(map(tuple, rows)))
+    assert sorted(rows) == expected
+
+
+def test_journal_counts_rows_without_copying_them(server, tmp_path, make_scraper, run_search, read_rows):
+    output = tmp_path / "people.csv"
+    run_search(make_scraper(server), output)
+
+    with open(f"{output}.journal", encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f]
+    rows = [entry for entry in entries if entry["event"] == "row"]
+    assert len(rows) == len(read_rows(output))
+    assert all(set(entry) == {"event", "time"} for entry in rows)
+
+    journal = RunJournal.load(f"{output}.journal")
+    assert journal.finished
+    assert journal.rows == len(rows)
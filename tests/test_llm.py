@@ -0,0 +1,28 @@
+from fakeserver import FakeServer
+
+from bbb_scraper.engine import Settings
+
+
+def test_profiles_left_out_of_a_batch_answer_are_asked_alone(tmp_path, make_scraper, run_search, read_rows):
+    settings = Settings(llm_batch_size=4)
+    with FakeServer(owners_listed=False) as server:
+        expected = run_search(make_scraper(server, settings), tmp_path / "whole.csv")
+    with FakeServer(owners_listed=False, llm_batch_drop=True) as server:
+        scraper = make_scraper(server, settings)
+        result = run_search(scraper, tmp_path / "dropped.csv")
+
+    assert scraper.metrics.counters["llm.batch_miss"] > 0
+    assert any(prompt.count("Profile ") > 1 for prompt in server.llm_prompts)
+    assert result.saved == expected.saved
+    assert sorted(read_rows(tmp_path / "dropped.csv")) == sorted(read_rows(tmp_path / "whole.csv"))
+
+
+def test_profile_text_seen_before_is_answered_from_the_memo(server, tmp_path, make_scraper, run_search):
+    # Two businesses of the fixture search share the same owner-less profile,
+    # and the second run meets it again
+    scraper = make_scraper(server)
+    run_search(scraper, tmp_path / "first.csv")
+    run_search(scraper, tmp_path / "second.csv")
+
+    assert len(server.llm_prompts) == 1
+    assert scraper.metrics.counters["llm.memo_hit"] > 0
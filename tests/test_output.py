@@ -0,0 +1,57 @@
+import csv
+
+from bbb_scraper.output import COLUMNS, CsvSink
+from bbb_scraper.records import PersonRecord
+
+
+def person(name, phones=1, emails=1):
+    return PersonRecord(name=name, age="40", position="Owner", address="1 Main St", city="Las Vegas", state="NV",
+                        business_name="Desert Valley Plumbing LLC", business_start_date="6/1/2008",
+                        phones=[f"(702) 555-{i:04d}" for i in range(phones)],
+                        emails=[f"{name.split()[0].lower()}{i}@example.com" for i in range(emails)])
+
+
+def read(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        return reader.fieldnames, list(reader)
+
+
+def test_duplicates_are_written_once(tmp_path):
+    with CsvSink(str(tmp_path / "people.csv")) as sink:
+        assert sink.write(person("Ann Lee"))
+        assert not sink.write(person("Ann Lee"))
+
+    columns, rows = read(tmp_path / "people.csv")
+    assert columns == COLUMNS
+    assert len(rows) == 1
+
+
+def test_row_with_more_phones_widens_the_file(tmp_path):
+    path = str(tmp_path / "people.csv")
+    with CsvSink(path) as sink:
+        sink.write(person("Ann Lee"))
+        sink.write(person("Bob Ray", phones=7, emails=6))
+        sink.write(person("Cy Dee"))
+        assert sink.widened == 1
+
+    columns, rows = read(path)
+    assert "Phone 6" in columns and "Email 5" in columns
+    assert [PersonRecord.from_row(row).phones for row in rows] == [person("Ann Lee").phones,
+                                                                  person("Bob Ray", phones=7).phones,
+                                                                  person("Cy Dee").phones]
+
+
+def test_resume_keeps_a_widened_header_and_skips_rows_already_written(tmp_path):
+    path = str(tmp_path / "people.csv")
+    with CsvSink(path) as sink:
+        sink.write(person("Bob Ray", phones=7))
+    with CsvSink(path, append=True) as sink:
+        assert not sink.write(person("Bob Ray", phones=7))
+        assert sink.write(person("Ann Lee", phones=6))
+        assert sink.widened == 0
+
+    columns, rows = read(path)
+    assert "Phone 6" in columns
+    assert len(rows) == 2
+    assert len(PersonRecord.from_row(rows[1]).phones) == 6
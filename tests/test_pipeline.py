@@ -0,0 +1,41 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from fakeserver import load_fixture
+
+from bbb_scraper.engine import Scraper
+from bbb_scraper.ratelimit import RateLimiter
+
+# 201 results pages
+SEARCH_PAGE = load_fixture("search_results.html").replace("Showing 45 results", "Showing 3015 results")
+
+
+class CountingPool:
+    """Serves the same search results page, counting the loads."""
+
+    size = 2
+
+    def __init__(self):
+        self.loads = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def session(self, timeout=None):
+        yield self
+
+    def get_page_source(self, url, timeout=30):
+        with self._lock:
+            self.loads += 1
+        return SEARCH_PAGE
+
+
+def test_search_pages_load_only_as_fast_as_they_are_read():
+    pool = CountingPool()
+    pages = Scraper("key").iter_urls("plumber", "Las Vegas", pool, rate_limiter=RateLimiter(1000, burst=1000))
+    next(pages)
+    next(pages)
+    time.sleep(0.2)
+    # Page 1, the page just read, and at most one more per worker
+    assert pool.loads <= 2 + pool.size
+    pages.close()
@@ -0,0 +1,40 @@
+import pytest
+from fakeserver import load_fixture
+
+from bbb_scraper.profile import BACKENDS, extract_profile
+
+PAGES = ["profile_owner.html", "profile_no_owner.html"]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("page", PAGES)
+def test_every_backend_extracts_the_same_profile(page, backend):
+    html = load_fixture(page)
+    assert extract_profile(html, backend) == extract_profile(html, "html.parser")
+
+
+def test_profile_fields():
+    profile = extract_profile(load_fixture("profile_owner.html"))
+
+    assert profile.name == "Desert Valley Plumbing LLC"
+    assert profile.address == "1234 W Sahara Ave Ste 100Las Vegas, NV 89102-3456"
+    assert profile.start_date == "6/1/2008"
+    assert profile.owners == ["Mr. Roderick Mays, Owner", "Dr. Angela  Mays, President", "Mr. Roderick Mays, Owner"]
+    # Page text is only kept for the LLM fallback
+    assert not profile.page_text
+
+
+def test_profile_without_owners_keeps_its_text():
+    profile = extract_profile(load_fixture("profile_no_owner.html"))
+
+    assert profile.owners == []
+    assert profile.owner_title() is None
+    assert "Founded by our owner Maria Lopez" in profile.page_text
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_page_without_profile_fields_gives_an_empty_profile(backend):
+    profile = extract_profile("<html><body><p>Access denied</p></body></html>", backend)
+
+    assert (profile.name, profile.address, profile.start_date, profile.owners) == (None, None, None, [])
+    assert profile.page_text == "Access denied"
@@ -0,0 +1,46 @@
+import csv
+
+import pytest
+
+from bbb_scraper.records import PersonRecord
+from bbb_scraper.store import ResultStore
+
+
+def person(name, phones=1):
+    return PersonRecord(name=name, age="40", position="Owner", business_name="Desert Valley Plumbing LLC",
+                        phones=[f"(702) 555-{i:04d}" for i in range(phones)], emails=["owner@example.com"])
+
+
+def test_store_keeps_every_phone_and_skips_duplicates(tmp_path):
+    with ResultStore(str(tmp_path / "people.sqlite3")) as store:
+        assert store.write(person("Ann Lee", phones=11))
+        assert not store.write(person("Ann Lee", phones=11))
+        assert store.write(person("Bob Ray"))
+        records = list(store.records())
+
+    assert [record.name for record in records] == ["Ann Lee", "Bob Ray"]
+    assert len(records[0].phones) == 11
+
+
+def test_append_keeps_earlier_rows(tmp_path):
+    path = str(tmp_path / "people.sqlite3")
+    with ResultStore(path) as store:
+        store.write(person("Ann Lee"))
+    with ResultStore(path, append=True) as store:
+        assert not store.write(person("Ann Lee"))
+        store.write(person("Bob Ray"))
+        assert len(store) == 2
+    with ResultStore(path) as store:
+        assert len(store) == 0
+
+
+@pytest.mark.parametrize("max_phones, columns", [(None, 11), (3, 3)])
+def test_csv_export_widens_to_the_longest_list(tmp_path, max_phones, columns):
+    with ResultStore(str(tmp_path / "people.sqlite3")) as store:
+        store.write(person("Ann Lee", phones=11))
+        store.write(person("Bob Ray"))
+        assert store.export_csv(str(tmp_path / "people.csv"), max_phones=max_phones) == 2
+
+    with open(tmp_path / "people.csv", newline="", encoding="utf-8") as f:
+        header = next(csv.reader(f))
+    assert sum(column.startswith("Phone ") for column in header) == columns
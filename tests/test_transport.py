@@ -0,0 +1,76 @@
+import time
+
+import pytest
+import requests
+
+from bbb_scraper.engine import Settings
+from bbb_scraper.transport import CircuitOpenError, Transport
+
+
+class FakeResponse:
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.headers = {}
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    """Answers with the next queued response, or raises it if it is an exception."""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+
+    def request(self, method, url, **kwargs):
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def close(self):
+        pass
+
+
+def make_transport(outcomes):
+    transport = Transport(limits={}, retries=0, breaker_failures=1, breaker_reset=0.0)
+    transport._session = FakeSession(outcomes)
+    return transport
+
+
+def test_breaker_recovers_after_unexpected_error_on_trial():
+    transport = make_transport([
+        requests.ConnectionError("down"),
+        # The half-open trial fails with an error that is not retried
+        requests.exceptions.ChunkedEncodingError("broken body"),
+        FakeResponse(200),
+    ])
+    with pytest.raises(requests.ConnectionError):
+        transport.get("http://example.test/a")
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        transport.get("http://example.test/a")
+    assert transport.get("http://example.test/a").status_code == 200
+
+
+def test_breaker_stays_open_until_reset():
+    transport = make_transport([requests.ConnectionError("down"), FakeResponse(200)])
+    transport.breaker_reset = 60.0
+    with pytest.raises(requests.ConnectionError):
+        transport.get("http://example.test/a")
+    with pytest.raises(CircuitOpenError):
+        transport.get("http://example.test/a")
+
+
+def test_circuit_closes_again_once_the_api_recovers(server, tmp_path, make_scraper, run_search):
+    transport = Transport(retries=0, breaker_failures=1, breaker_reset=0.2)
+    # Page loads go through the pool, so only scrape.do and the LLM use the transport
+    settings = Settings(http_fast_path=False)
+
+    server.scrapedo_down = True
+    scraper = make_scraper(server, settings, transport=transport)
+    assert run_search(scraper, tmp_path / "down.csv").saved == 0
+    assert scraper.metrics.counters["http.circuit_open"] > 0
+
+    server.scrapedo_down = False
+    time.sleep(0.3)
+    assert run_search(make_scraper(server, settings, transport=transport), tmp_path / "up.csv").saved > 0